@@ -4,7 +4,7 @@ Endpoints for managing automated monitoring of social media channels/accounts
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from db.session import get_db
@@ -48,12 +48,15 @@ def create_monitoring_job(
 
 @router.get("/monitoring/jobs", response_model=List[MonitoringJobResponse])
 def get_monitoring_jobs(
+    response: Response,
     params: MonitoringJobFilterParams = Depends(),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """
     Get all monitoring jobs for the current user
+    
+    The total number of matching jobs is returned in the X-Total-Count header.
     """
     service = MonitoringService(db)
     
@@ -61,13 +64,14 @@ def get_monitoring_jobs(
     platform = PlatformType(params.platform) if params.platform else None
     status = MonitoringStatus(params.status) if params.status else None
     
-    jobs = service.get_monitoring_jobs(
+    jobs, total = service.get_monitoring_jobs_page(
         user_id=current_user.id,
         platform=platform,
         status=status,
         skip=params.skip,
         limit=params.limit
     )
+    response.headers["X-Total-Count"] = str(total)
     return jobs
 
 
@@ -204,7 +208,7 @@ def execute_monitoring_job(
     
     # Execute the job
     try:
-        run = service.execute_job(job_id)
+        run = service.execute_job(existing_job)
         return run
     except Exception as e:
         raise HTTPException(
@@ -18,6 +18,12 @@ router = APIRouter(
 )
 
 
+def _serialize(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the engine's Recommendation objects to response dictionaries"""
+    result["recommendations"] = [rec.to_dict() for rec in result["recommendations"]]
+    return result
+
+
 @router.get("/")
 async def get_general_recommendations(
     platform: Optional[str] = Query(None, description="Filter by platform"),
@@ -49,7 +55,7 @@ async def get_general_recommendations(
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
             
-        return result
+        return _serialize(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -81,7 +87,7 @@ async def get_post_recommendations(
         if not result["success"]:
             raise HTTPException(status_code=404, detail=result["message"])
             
-        return result
+        return _serialize(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -139,7 +145,7 @@ async def get_recommendations_by_type(
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
             
-        return result
+        return _serialize(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -14,6 +14,12 @@ class Settings(BaseSettings):
     
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./social_media_analysis.db")
+    DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+    DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+    DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))  # seconds
+    SLOW_QUERY_THRESHOLD: float = float(os.getenv("SLOW_QUERY_THRESHOLD", "0.1"))  # seconds
+    # Bound values can hold emails and tokens; only log them when debugging locally
+    SLOW_QUERY_LOG_PARAMETERS: bool = os.getenv("SLOW_QUERY_LOG_PARAMETERS", "false").lower() == "true"
     
     # API settings
     API_V1_STR: str = "/api/v1"
@@ -25,6 +31,21 @@ class Settings(BaseSettings):
     
     # Monitoring settings
     MONITORING_CHECK_INTERVAL: int = 60  # seconds
+    MONITORING_MAX_CONCURRENT: int = int(os.getenv("MONITORING_MAX_CONCURRENT", "4"))  # downloads in flight
+    MONITORING_BATCH_SIZE: int = int(os.getenv("MONITORING_BATCH_SIZE", "100"))  # jobs claimed per pass
+    # Per-platform download concurrency, to stay under each platform's rate limits
+    MONITORING_CONCURRENCY_YOUTUBE: int = int(os.getenv("MONITORING_CONCURRENCY_YOUTUBE", "4"))
+    MONITORING_CONCURRENCY_INSTAGRAM: int = int(os.getenv("MONITORING_CONCURRENCY_INSTAGRAM", "2"))
+    MONITORING_CONCURRENCY_THREADS: int = int(os.getenv("MONITORING_CONCURRENCY_THREADS", "2"))
+    MONITORING_CONCURRENCY_REDNOTE: int = int(os.getenv("MONITORING_CONCURRENCY_REDNOTE", "2"))
+    
+    # Notification email settings (emails are skipped when SMTP_HOST is unset)
+    SMTP_HOST: str = os.getenv("SMTP_HOST", "")
+    SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
+    SMTP_USERNAME: str = os.getenv("SMTP_USERNAME", "")
+    SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
+    SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
+    SMTP_FROM: str = os.getenv("SMTP_FROM", "monitoring@localhost")
 
     class Config:
         case_sensitive = True
@@ -3,6 +3,8 @@ SQLAlchemy models for Social Media Analysis Platform
 """
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Float, Boolean, ForeignKey, Enum, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -10,6 +12,9 @@ import enum
 
 from backend.db.base_models import Base
 
+# JSON object column that tracks in-place changes, stored as JSONB on PostgreSQL
+MutableJSONDict = MutableDict.as_mutable(JSON().with_variant(JSONB(), "postgresql"))
+
 
 class PlatformType(enum.Enum):
     """Supported social media platforms"""
@@ -49,6 +54,7 @@ class MonitoringFrequency(enum.Enum):
 class MonitoringStatus(enum.Enum):
     """Monitoring job status"""
     ACTIVE = "active"
+    RUNNING = "running"  # Claimed by a scheduler worker, see MonitoringService.claim_pending_jobs
     PAUSED = "paused"
     COMPLETED = "completed"
     FAILED = "failed"
@@ -400,8 +406,8 @@ class MonitoringJob(Base):
     notification_email = Column(String(255))
     
     # Advanced options
-    download_options = Column(JSON)  # Additional download configuration options
-    filter_criteria = Column(JSON)  # Criteria for filtering content to download
+    download_options = Column(MutableJSONDict)  # Additional download configuration options
+    filter_criteria = Column(MutableJSONDict)  # Criteria for filtering content to download
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -412,6 +418,10 @@ class MonitoringJob(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     user = relationship("User")
     
+    # Run history; the database deletes runs along with their job
+    runs = relationship("MonitoringRun", back_populates="monitoring_job",
+                        cascade="all, delete-orphan", passive_deletes=True)
+    
     # Indexes for common queries
     __table_args__ = (
         Index('idx_monitoring_status_next_run', 'status', 'next_run_at'),
@@ -460,8 +470,8 @@ class MonitoringRun(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Relationship to monitoring job
-    monitoring_job_id = Column(Integer, ForeignKey("monitoring_jobs.id"), nullable=False, index=True)
-    monitoring_job = relationship("MonitoringJob")
+    monitoring_job_id = Column(Integer, ForeignKey("monitoring_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    monitoring_job = relationship("MonitoringJob", back_populates="runs")
     
     # Run information
     start_time = Column(DateTime(timezone=True), server_default=func.now())
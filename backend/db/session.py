@@ -2,15 +2,54 @@
 Database session management for Social Media Analysis Platform
 """
 
-from sqlalchemy import create_engine
+import logging
+import time
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from typing import Generator
 
 from backend.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create the SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URL)
+if settings.DATABASE_URL.startswith("sqlite"):
+    # SQLite connections are local files; the default pool is enough
+    engine = create_engine(settings.DATABASE_URL)
+else:
+    # Size the pool for concurrent scheduler passes; pre-ping and recycle
+    # drop connections the server closed while they sat idle
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE
+    )
+
+if engine.dialect.name == "sqlite":
+    # SQLite only enforces foreign keys (and ON DELETE CASCADE) when asked
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+# Log statements slower than SLOW_QUERY_THRESHOLD to catch N+1 patterns
+# and missing indexes before they reach production
+@event.listens_for(engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+@event.listens_for(engine, "after_cursor_execute")
+def log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start_time
+    if elapsed > settings.SLOW_QUERY_THRESHOLD:
+        logger.warning("Slow query (%.0f ms): %s", elapsed * 1000, statement)
+        if settings.SLOW_QUERY_LOG_PARAMETERS:
+            logger.debug("Slow query parameters: %r", parameters)
 
 # Create a sessionmaker factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,28 @@
+"""Add RUNNING monitoring status
+
+Revision ID: 20240405_monitoring_running
+Revises: 20240321_add_trend_data
+Create Date: 2024-04-05 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20240405_monitoring_running'
+down_revision = '20240321_add_trend_data'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Scheduler workers mark claimed jobs RUNNING; PostgreSQL stores the
+    # status as a native enum type that needs the new label
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE monitoringstatus ADD VALUE IF NOT EXISTS 'RUNNING'")
+
+
+def downgrade():
+    # PostgreSQL cannot drop an enum label; release any claimed jobs instead
+    op.execute("UPDATE monitoring_jobs SET status = 'ACTIVE' WHERE status = 'RUNNING'")
@@ -0,0 +1,52 @@
+"""Cascade monitoring run deletes from their job
+
+Revision ID: 20240406_cascade_monitoring_runs
+Revises: 20240405_monitoring_running
+Create Date: 2024-04-06 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20240406_cascade_monitoring_runs'
+down_revision = '20240405_monitoring_running'
+branch_labels = None
+depends_on = None
+
+# SQLite reflects the original foreign key without a name; batch mode names
+# it by this convention so it can be dropped when the table is recreated
+NAMING_CONVENTION = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'
+}
+
+
+def _job_fk_name():
+    """Name of the monitoring_runs.monitoring_job_id foreign key as stored in the database"""
+    inspector = sa.inspect(op.get_bind())
+    for fk in inspector.get_foreign_keys('monitoring_runs'):
+        if fk['constrained_columns'] == ['monitoring_job_id']:
+            return fk['name'] or 'fk_monitoring_runs_monitoring_job_id_monitoring_jobs'
+    raise RuntimeError('monitoring_runs has no foreign key on monitoring_job_id')
+
+
+def _replace_job_fk(**kwargs):
+    """Recreate the job foreign key under its existing name with the given options"""
+    name = _job_fk_name()
+    with op.batch_alter_table('monitoring_runs', naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(name, type_='foreignkey')
+        batch_op.create_foreign_key(
+            name,
+            'monitoring_jobs',
+            ['monitoring_job_id'],
+            ['id'],
+            **kwargs
+        )
+
+
+def upgrade():
+    _replace_job_fk(ondelete='CASCADE')
+
+
+def downgrade():
+    _replace_job_fk()
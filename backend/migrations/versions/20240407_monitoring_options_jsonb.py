@@ -0,0 +1,43 @@
+"""Store monitoring job options as JSONB
+
+Revision ID: 20240407_monitoring_jsonb
+Revises: 20240406_cascade_monitoring_runs
+Create Date: 2024-04-07 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20240407_monitoring_jsonb'
+down_revision = '20240406_cascade_monitoring_runs'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ('download_options', 'filter_criteria')
+
+
+def upgrade():
+    # Other databases keep the generic JSON type
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in COLUMNS:
+        op.alter_column(
+            'monitoring_jobs',
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in COLUMNS:
+        op.alter_column(
+            'monitoring_jobs',
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json'
+        )
@@ -4,10 +4,11 @@ Services package for content extraction and processing
 
 from .base_extractor import BaseContentExtractor
 from .browser_manager import BrowserManager
-from .rate_limiter import RateLimiter
+from .rate_limiter import RateLimiter, TokenBucketRateLimiter
 
 __all__ = [
     "BaseContentExtractor",
     "BrowserManager", 
-    "RateLimiter"
+    "RateLimiter",
+    "TokenBucketRateLimiter"
 ]
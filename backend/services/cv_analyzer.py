@@ -9,20 +9,68 @@ import os
 import cv2
 import numpy as np
 from PIL import Image
-import tensorflow as tf
 from transformers import AutoFeatureExtractor, AutoModelForImageClassification
 import logging
 import tempfile
 import json
-from typing import Dict, List, Tuple, Optional, Any, Union
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional, Any, Union
 from pathlib import Path
 import torch
 from torchvision import transforms
 
+try:
+    import av
+except ImportError:
+    av = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# H.264 decode on NVIDIA's fixed-function decoder (NVDEC), converted to BGR for OpenCV
+GSTREAMER_HW_DECODE_PIPELINE = (
+    "filesrc location={location} ! qtdemux ! h264parse ! nvv4l2decoder ! nvvidconv ! "
+    "video/x-raw,format=BGRx ! videoconvert ! video/x-raw,format=BGR ! appsink"
+)
+
+
+@lru_cache(maxsize=1)
+def _opencv_has_gstreamer() -> bool:
+    """Check once whether the installed OpenCV build includes the GStreamer backend."""
+    for line in cv2.getBuildInformation().splitlines():
+        if line.strip().startswith("GStreamer:"):
+            return "YES" in line
+    return False
+
+
+def _gst_quote(value: str) -> str:
+    """Quote a value for a gst-launch pipeline description so spaces and '!' stay literal."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@dataclass(repr=False)
+class _AnalyzedFrame:
+    """
+    A decoded image with its color-space conversions computed once.
+
+    Analyses that need RGB or grayscale pixels read them from here instead
+    of re-running cv2.cvtColor on the same BGR data.
+    """
+    bgr: np.ndarray
+    rgb: np.ndarray
+    gray: np.ndarray
+
+    @classmethod
+    def from_bgr(cls, bgr: np.ndarray) -> "_AnalyzedFrame":
+        """Build a frame from a BGR array as returned by OpenCV."""
+        return cls(
+            bgr=bgr,
+            rgb=cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB),
+            gray=cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+        )
+
+
 class CVService:
     """
     Service for computer vision analysis of images and videos.
@@ -35,6 +83,16 @@ class CVService:
     - Keyframe extraction from videos
     """
     
+    # Number of dominant colors reported by color analysis
+    DOMINANT_COLOR_COUNT = 5
+    
+    # Images whose per-channel standard deviation stays below this are
+    # treated as monochromatic and skip k-means clustering
+    LOW_COLOR_VARIANCE = 5.0
+    
+    # Try GPU video decoding through GStreamer before software decoding
+    USE_HW_VIDEO_DECODE = os.getenv("CV_HW_VIDEO_DECODE", "true").lower() == "true"
+    
     def __init__(self):
         """Initialize the Computer Vision service with necessary models."""
         logger.info("Initializing Computer Vision Service")
@@ -97,6 +155,24 @@ class CVService:
             logger.error(f"Error preprocessing image {image_path}: {str(e)}")
             raise
             
+    def _load_frame(self, image: Union[str, _AnalyzedFrame]) -> _AnalyzedFrame:
+        """
+        Return an analyzed frame for an image path, or the frame itself if already loaded.
+        
+        Args:
+            image: Path to the image file or a previously loaded frame
+            
+        Returns:
+            Frame holding the BGR, RGB and grayscale versions of the image
+        """
+        if isinstance(image, _AnalyzedFrame):
+            return image
+            
+        img = cv2.imread(image)
+        if img is None:
+            raise ValueError(f"Could not read image at {image}")
+        return _AnalyzedFrame.from_bgr(img)
+            
     def detect_objects(self, image_path: str) -> List[Dict[str, Any]]:
         """
         Detect objects in an image.
@@ -177,12 +253,12 @@ class CVService:
             logger.error(f"Error recognizing scene in {image_path}: {str(e)}")
             return {"error": 1.0}
             
-    def detect_faces(self, image_path: str) -> List[Dict[str, Any]]:
+    def detect_faces(self, image_path: Union[str, _AnalyzedFrame]) -> List[Dict[str, Any]]:
         """
         Detect faces in an image.
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an already loaded frame
             
         Returns:
             List of detected faces with bounding boxes and confidence scores
@@ -194,17 +270,12 @@ class CVService:
             return []
             
         try:
-            # Read image
-            img = cv2.imread(image_path)
-            if img is None:
-                raise ValueError(f"Could not read image at {image_path}")
-                
-            # Convert to grayscale for face detection
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            # Face detection runs on the grayscale image
+            frame = self._load_frame(image_path)
             
             # Detect faces
             faces = self.face_cascade.detectMultiScale(
-                gray,
+                frame.gray,
                 scaleFactor=1.1,
                 minNeighbors=5,
                 minSize=(30, 30)
@@ -223,24 +294,19 @@ class CVService:
             logger.error(f"Error detecting faces in {image_path}: {str(e)}")
             return []
             
-    def analyze_colors(self, image_path: str) -> Dict[str, Any]:
+    def analyze_colors(self, image_path: Union[str, _AnalyzedFrame]) -> Dict[str, Any]:
         """
         Analyze the color distribution of an image.
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an already loaded frame
             
         Returns:
             Dictionary with color analysis results
         """
         try:
-            # Read image
-            img = cv2.imread(image_path)
-            if img is None:
-                raise ValueError(f"Could not read image at {image_path}")
-                
-            # Convert to RGB
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            frame = self._load_frame(image_path)
+            img_rgb = frame.rgb
             
             # Reshape the image to be a list of pixels
             pixels = img_rgb.reshape((-1, 3))
@@ -249,42 +315,153 @@ class CVService:
             mean_color = pixels.mean(axis=0).tolist()
             std_color = pixels.std(axis=0).tolist()
             
-            # Calculate dominant colors using K-means clustering
-            pixels = np.float32(pixels)
-            criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 200, 0.1)
-            k = 5  # Number of dominant colors
-            _, labels, centers = cv2.kmeans(pixels, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
-            
-            # Count occurrences of each cluster
-            counts = np.bincount(labels.flatten())
-            
-            # Sort clusters by count (most frequent first)
-            sorted_indices = np.argsort(counts)[::-1]
-            sorted_centers = centers[sorted_indices].astype(int).tolist()
-            sorted_percentages = (counts[sorted_indices] / len(labels) * 100).tolist()
-            
-            # Prepare dominant colors
-            dominant_colors = []
-            for i in range(min(k, len(sorted_centers))):
-                dominant_colors.append({
-                    "rgb": sorted_centers[i],
-                    "percentage": sorted_percentages[i]
-                })
-                
-            # Calculate brightness
-            brightness = np.mean(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY))
-            
-            return {
-                "mean_color": mean_color,
-                "std_color": std_color,
-                "dominant_colors": dominant_colors,
-                "brightness": brightness,
-                "is_grayscale": self._is_grayscale(img_rgb)
-            }
+            return self._summarize_colors(frame, pixels, mean_color, std_color)
         except Exception as e:
             logger.error(f"Error analyzing colors in {image_path}: {str(e)}")
             return {"error": str(e)}
             
+    def analyze_colors_batch(self, frames: List[Union[np.ndarray, _AnalyzedFrame]]) -> List[Dict[str, Any]]:
+        """
+        Analyze the color distribution of several in-memory frames.
+        
+        Output statistics and the float32 pixel buffer are allocated once for
+        the whole batch and reused for every frame, instead of allocating a
+        fresh float32 copy of each frame as analyze_colors does.
+        
+        Args:
+            frames: BGR frames or already loaded frames
+            
+        Returns:
+            List of color analysis results, one per frame
+        """
+        frames = [f if isinstance(f, _AnalyzedFrame) else _AnalyzedFrame.from_bgr(f) for f in frames]
+        
+        n = len(frames)
+        out_mean = np.empty((n, 3), dtype=np.float32)
+        out_std = np.empty((n, 3), dtype=np.float32)
+        max_pixels = max((f.rgb.shape[0] * f.rgb.shape[1] for f in frames), default=0)
+        scratch = np.empty((max_pixels, 3), dtype=np.float32)
+        
+        results = []
+        for i, frame in enumerate(frames):
+            try:
+                rgb_pixels = frame.rgb.reshape((-1, 3))
+                pixels = scratch[:len(rgb_pixels)]
+                np.copyto(pixels, rgb_pixels, casting='unsafe')
+                
+                pixels.mean(axis=0, out=out_mean[i])
+                pixels.std(axis=0, out=out_std[i])
+                
+                results.append(self._summarize_colors(
+                    frame, pixels, out_mean[i].tolist(), out_std[i].tolist()
+                ))
+            except Exception as e:
+                logger.error(f"Error analyzing colors of frame {i}: {str(e)}")
+                results.append({"error": str(e)})
+                
+        return results
+        
+    def _summarize_colors(self, frame: _AnalyzedFrame, pixels: np.ndarray,
+                          mean_color: List[float], std_color: List[float]) -> Dict[str, Any]:
+        """
+        Build the color analysis result from precomputed channel statistics.
+        
+        Args:
+            frame: The analyzed frame
+            pixels: RGB pixels of the frame with shape (N, 3)
+            mean_color: Per-channel mean
+            std_color: Per-channel standard deviation
+            
+        Returns:
+            Dictionary with color analysis results
+        """
+        # Flat and grayscale images gain nothing from k-means, so derive
+        # their dominant colors from cheap statistics instead
+        is_grayscale = self._is_grayscale(frame.rgb)
+        if max(std_color) < self.LOW_COLOR_VARIANCE:
+            dominant_colors = [{
+                "rgb": [int(c) for c in mean_color],
+                "percentage": 100.0
+            }]
+        elif is_grayscale:
+            dominant_colors = self._histogram_dominant_colors(frame.gray)
+        else:
+            dominant_colors = self._kmeans_dominant_colors(pixels)
+            
+        # Calculate brightness from the cached grayscale image
+        brightness = float(frame.gray.mean())
+        
+        return {
+            "mean_color": mean_color,
+            "std_color": std_color,
+            "dominant_colors": dominant_colors,
+            "brightness": brightness,
+            "is_grayscale": is_grayscale
+        }
+        
+    def _kmeans_dominant_colors(self, pixels: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Find dominant colors using K-means clustering.
+        
+        Args:
+            pixels: Array of RGB pixels with shape (N, 3)
+            
+        Returns:
+            List of dominant colors sorted by frequency
+        """
+        # No copy when the pixels are already a float32 buffer
+        pixels = np.ascontiguousarray(pixels, dtype=np.float32)
+        criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 200, 0.1)
+        k = self.DOMINANT_COLOR_COUNT
+        _, labels, centers = cv2.kmeans(pixels, k, None, criteria, 10, cv2.KMEANS_RANDOM_CENTERS)
+        
+        # Count occurrences of each cluster
+        counts = np.bincount(labels.flatten())
+        
+        # Sort clusters by count (most frequent first)
+        sorted_indices = np.argsort(counts)[::-1]
+        sorted_centers = centers[sorted_indices].astype(int).tolist()
+        sorted_percentages = (counts[sorted_indices] / len(labels) * 100).tolist()
+        
+        # Prepare dominant colors
+        dominant_colors = []
+        for i in range(min(k, len(sorted_centers))):
+            dominant_colors.append({
+                "rgb": sorted_centers[i],
+                "percentage": sorted_percentages[i]
+            })
+            
+        return dominant_colors
+        
+    def _histogram_dominant_colors(self, gray: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Approximate dominant colors of a grayscale image from its intensity histogram.
+        
+        Args:
+            gray: Grayscale image as numpy array
+            
+        Returns:
+            List of dominant gray levels sorted by frequency
+        """
+        counts, edges = np.histogram(gray, bins=self.DOMINANT_COLOR_COUNT, range=(0, 256))
+        
+        # Represent each bin by the mean intensity of its pixels
+        sums, _ = np.histogram(gray, bins=edges, weights=gray)
+        centers = (edges[:-1] + edges[1:]) / 2
+        levels = np.divide(sums, counts, out=centers, where=counts > 0)
+        
+        dominant_colors = []
+        for i in np.argsort(counts)[::-1]:
+            if counts[i] == 0:
+                break
+            level = int(levels[i])
+            dominant_colors.append({
+                "rgb": [level, level, level],
+                "percentage": float(counts[i] / gray.size * 100)
+            })
+            
+        return dominant_colors
+            
     def _is_grayscale(self, img_rgb: np.ndarray) -> bool:
         """
         Check if an image is grayscale.
@@ -309,80 +486,210 @@ class CVService:
             np.mean(g_b_diff) < threshold
         )
         
-    def extract_keyframes(self, video_path: str, max_frames: int = 10) -> List[Dict[str, Any]]:
+    def _iter_keyframes_pyav(self, video_path: str, max_frames: int) -> Iterator[Tuple[int, float, np.ndarray]]:
         """
-        Extract key frames from a video file.
+        Decode only the I-frames of a video with PyAV.
+        
+        The decoder is told to skip every non-key frame, so inter frames are
+        never decoded. Keyframes are thinned out evenly over the video's
+        duration when there are more than max_frames of them.
+        
+        Args:
+            video_path: Path to the video file
+            max_frames: Maximum number of frames to yield
+            
+        Yields:
+            Tuples of (frame index, timestamp in seconds, BGR frame)
+        """
+        with av.open(video_path) as container:
+            stream = container.streams.video[0]
+            stream.codec_context.skip_frame = "NONKEY"
+            
+            fps = float(stream.average_rate) if stream.average_rate else 0.0
+            duration = float(stream.duration * stream.time_base) if stream.duration else 0.0
+            min_gap = duration / max_frames if duration > 0 else 0.0
+            
+            yielded = 0
+            last_timestamp = None
+            for frame in container.decode(stream):
+                timestamp = float(frame.time) if frame.time is not None else 0.0
+                if last_timestamp is not None and timestamp - last_timestamp < min_gap:
+                    continue
+                    
+                frame_idx = int(round(timestamp * fps))
+                yield frame_idx, timestamp, frame.to_ndarray(format="bgr24")
+                
+                last_timestamp = timestamp
+                yielded += 1
+                if yielded >= max_frames:
+                    break
+                    
+    def _iter_frames_opencv(self, video_path: str, max_frames: int) -> Iterator[Tuple[int, float, np.ndarray]]:
+        """
+        Sample frames at a fixed interval by sequentially decoding with OpenCV.
         
         Args:
             video_path: Path to the video file
             max_frames: Maximum number of frames to extract
             
-        Returns:
-            List of dictionaries containing frame data and timestamps
+        Yields:
+            Tuples of (frame index, timestamp in seconds, BGR frame)
         """
+        # Open the video file
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise ValueError(f"Could not open video at {video_path}")
+            
         try:
-            # Open the video file
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                raise ValueError(f"Could not open video at {video_path}")
-                
-            # Get video properties
+            # Get video properties (GStreamer pipelines do not report them reliably)
             frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
             fps = cap.get(cv2.CAP_PROP_FPS)
-            duration = frame_count / fps if fps > 0 else 0
             
+            # Decode on the GPU when a hardware pipeline can produce frames
+            hw_cap = self._open_hw_video_capture(video_path)
+            if hw_cap is not None:
+                ret, first_frame = hw_cap.read()
+                if ret:
+                    cap.release()
+                    cap = hw_cap
+                else:
+                    hw_cap.release()
+                    first_frame = None
+            else:
+                first_frame = None
+                
             # Calculate frame interval for keyframe extraction
             if frame_count <= max_frames:
                 interval = 1
             else:
                 interval = frame_count // max_frames
                 
-            keyframes = []
-            prev_frame = None
             frame_idx = 0
+            while True:
+                if first_frame is not None:
+                    ret, frame = True, first_frame
+                    first_frame = None
+                else:
+                    ret, frame = cap.read()
+                if not ret:
+                    break
+                    
+                # Process only frames at the calculated interval
+                if frame_idx % interval == 0:
+                    timestamp = frame_idx / fps if fps > 0 else 0
+                    yield frame_idx, timestamp, frame
+                    
+                frame_idx += 1
+        finally:
+            # Release the video capture object
+            cap.release()
+            
+    def _open_hw_video_capture(self, video_path: str) -> Optional[cv2.VideoCapture]:
+        """
+        Open a video through a hardware-accelerated GStreamer decode pipeline.
+        
+        Only MP4/MOV containers are tried, and only when OpenCV was built with
+        GStreamer support. Hosts without the NVDEC plugins simply fail to open
+        the pipeline and the caller keeps software decoding.
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            An opened VideoCapture, or None if hardware decoding is unavailable
+        """
+        if not self.USE_HW_VIDEO_DECODE or not _opencv_has_gstreamer():
+            return None
+        if Path(video_path).suffix.lower() not in (".mp4", ".mov", ".m4v"):
+            return None
+            
+        try:
+            pipeline = GSTREAMER_HW_DECODE_PIPELINE.format(location=_gst_quote(str(video_path)))
+            cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+        except Exception as e:
+            logger.debug(f"Hardware video decode unavailable for {video_path}: {str(e)}")
+            return None
+            
+        if not cap.isOpened():
+            cap.release()
+            return None
+        return cap
+        
+    def _iter_video_frames(self, video_path: str, max_frames: int) -> Iterator[Tuple[int, float, np.ndarray]]:
+        """
+        Yield the frames to analyze from a video.
+        
+        Uses PyAV keyframe decoding when available and falls back to
+        OpenCV interval sampling if PyAV is missing or cannot read the file.
+        
+        Args:
+            video_path: Path to the video file
+            max_frames: Maximum number of frames to extract
+            
+        Yields:
+            Tuples of (frame index, timestamp in seconds, BGR frame)
+        """
+        if av is not None:
+            frames = []
+            try:
+                frames = list(self._iter_keyframes_pyav(video_path, max_frames))
+            except Exception as e:
+                logger.warning(f"PyAV keyframe decoding failed for {video_path}, falling back to OpenCV: {str(e)}")
+                
+            if frames:
+                yield from frames
+                return
+                
+        yield from self._iter_frames_opencv(video_path, max_frames)
+        
+    def extract_keyframes(self, video_path: str, max_frames: int = 10) -> List[Dict[str, Any]]:
+        """
+        Extract key frames from a video file.
+        
+        Args:
+            video_path: Path to the video file
+            max_frames: Maximum number of frames to extract
+            
+        Returns:
+            List of dictionaries containing frame data and timestamps
+        """
+        try:
+            keyframes = []
+            analyzed_frames = []
+            prev_gray = None
             
             # Create temporary directory for saving frames
             with tempfile.TemporaryDirectory() as temp_dir:
-                while True:
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-                        
-                    # Process only frames at the calculated interval
-                    if frame_idx % interval == 0:
-                        # Calculate timestamp
-                        timestamp = frame_idx / fps if fps > 0 else 0
-                        
-                        # Save frame to temp file
-                        frame_path = os.path.join(temp_dir, f"frame_{frame_idx}.jpg")
-                        cv2.imwrite(frame_path, frame)
-                        
-                        # Add frame info to results
-                        keyframes.append({
-                            "frame_idx": frame_idx,
-                            "timestamp": timestamp,
-                            "timestamp_str": self._format_timestamp(timestamp),
-                            "path": frame_path,
-                            "scene_change": self._is_scene_change(prev_frame, frame) if prev_frame is not None else False
-                        })
-                        
-                        prev_frame = frame.copy()
-                        
-                    frame_idx += 1
+                for frame_idx, timestamp, frame in self._iter_video_frames(video_path, max_frames):
+                    analyzed = _AnalyzedFrame.from_bgr(frame)
                     
-                # Release the video capture object
-                cap.release()
-                
-                # Further analyze each keyframe
-                for kf in keyframes:
+                    # Save frame to temp file
+                    frame_path = os.path.join(temp_dir, f"frame_{frame_idx}.jpg")
+                    cv2.imwrite(frame_path, frame)
+                    
+                    # Add frame info to results
+                    keyframes.append({
+                        "frame_idx": frame_idx,
+                        "timestamp": timestamp,
+                        "timestamp_str": self._format_timestamp(timestamp),
+                        "path": frame_path,
+                        "scene_change": self._is_scene_change(prev_gray, analyzed.gray) if prev_gray is not None else False
+                    })
+                    analyzed_frames.append(analyzed)
+                    
+                    prev_gray = analyzed.gray
+                    
+                # Further analyze each keyframe, reusing the decoded frames
+                colors = self.analyze_colors_batch(analyzed_frames)
+                for kf, analyzed, kf_colors in zip(keyframes, analyzed_frames, colors):
                     # Add scene recognition
                     kf["scene"] = self.recognize_scene(kf["path"])
                     
                     # Add face detection
-                    kf["faces"] = self.detect_faces(kf["path"])
+                    kf["faces"] = self.detect_faces(analyzed)
                     
                     # Add color analysis
-                    kf["colors"] = self.analyze_colors(kf["path"])
+                    kf["colors"] = kf_colors
                     
                 return keyframes
         except Exception as e:
@@ -403,22 +710,18 @@ class CVService:
         h, m = divmod(m, 60)
         return f"{int(h):02d}:{int(m):02d}:{int(s):02d}"
         
-    def _is_scene_change(self, prev_frame: np.ndarray, curr_frame: np.ndarray, threshold: float = 30.0) -> bool:
+    def _is_scene_change(self, prev_gray: np.ndarray, curr_gray: np.ndarray, threshold: float = 30.0) -> bool:
         """
         Detect if there is a scene change between two consecutive frames.
         
         Args:
-            prev_frame: Previous frame
-            curr_frame: Current frame
+            prev_gray: Previous frame in grayscale
+            curr_gray: Current frame in grayscale
             threshold: Difference threshold for scene change detection
             
         Returns:
             True if scene change detected, False otherwise
         """
-        # Convert frames to grayscale
-        prev_gray = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-        curr_gray = cv2.cvtColor(curr_frame, cv2.COLOR_BGR2GRAY)
-        
         # Calculate absolute difference
         frame_diff = cv2.absdiff(prev_gray, curr_gray)
         
@@ -445,11 +748,11 @@ class CVService:
                 "file_size": os.path.getsize(image_path)
             }
             
+            # Decode once and share the conversions across analyses
+            frame = self._load_frame(image_path)
+            img = frame.bgr
+            
             # Get image dimensions
-            img = cv2.imread(image_path)
-            if img is None:
-                raise ValueError(f"Could not read image at {image_path}")
-                
             results["dimensions"] = {
                 "width": img.shape[1],
                 "height": img.shape[0],
@@ -459,8 +762,8 @@ class CVService:
             # Perform various analyses
             results["objects"] = self.detect_objects(image_path)
             results["scene"] = self.recognize_scene(image_path)
-            results["faces"] = self.detect_faces(image_path)
-            results["colors"] = self.analyze_colors(image_path)
+            results["faces"] = self.detect_faces(frame)
+            results["colors"] = self.analyze_colors(frame)
             
             return results
         except Exception as e:
@@ -6,6 +6,7 @@ Manages download jobs, file storage, and database integration.
 """
 
 import asyncio
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -34,7 +35,6 @@ class ContentExtractionService:
         """Initialize the extraction service"""
         # Initialize downloads directory
         self.downloads_dir = Path(settings.downloads_path)
-        self.downloads_dir.mkdir(parents=True, exist_ok=True)
         
         # Create platform-specific directories
         self._create_platform_directories()
@@ -45,19 +45,38 @@ class ContentExtractionService:
         # Store active jobs
         self.active_jobs: Dict[str, Dict[str, Any]] = {}
     
+    PLATFORMS = ("youtube", "instagram", "threads", "rednote")
+    CONTENT_TYPES = ("videos", "images", "text")
+    
     def _create_platform_directories(self) -> None:
         """Create directory structure for each platform"""
-        platforms = ["youtube", "instagram", "threads", "rednote"]
-        content_types = ["videos", "images", "text"]
-        
-        for platform in platforms:
-            platform_dir = self.downloads_dir / platform
-            platform_dir.mkdir(exist_ok=True)
-            
-            for content_type in content_types:
-                content_dir = platform_dir / content_type
-                content_dir.mkdir(exist_ok=True)
+        # Only the leaf directories are needed; mkdir(parents=True) creates the
+        # platform directories on the way, and existing ones cost a single stat
+        for platform in self.PLATFORMS:
+            for content_type in self.CONTENT_TYPES:
+                content_dir = self.downloads_dir / platform / content_type
+                if not content_dir.is_dir():
+                    content_dir.mkdir(parents=True, exist_ok=True)
+
+
+# Global instance, created on first use by get_extraction_service()
+content_extraction_service: Optional[ContentExtractionService] = None
+_extraction_service_lock = threading.Lock()
 
 
-# Global instance
-content_extraction_service = ContentExtractionService()
+def get_extraction_service() -> ContentExtractionService:
+    """
+    Get the global content extraction service instance.
+    
+    The service (and its download directory tree) is created lazily on the
+    first call rather than at import time.
+    
+    Returns:
+        ContentExtractionService instance
+    """
+    global content_extraction_service
+    if content_extraction_service is None:
+        with _extraction_service_lock:
+            if content_extraction_service is None:
+                content_extraction_service = ContentExtractionService()
+    return content_extraction_service
@@ -0,0 +1,121 @@
+"""
+Instagram Cache - Persistent TTL cache of extracted content keyed by shortcode
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Per-user cache location, kept out of the working tree and download directory
+DEFAULT_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "social-media-analysis" / "instagram_content.sqlite3"
+)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class InstagramCache:
+    """
+    SQLite-backed cache of extracted Instagram content
+    
+    Post metadata rarely changes for a given shortcode, so cached entries
+    let repeat extractions skip the network (and the rate limit budget)
+    entirely until they expire. Calls are blocking; async callers should
+    run them in a worker thread.
+    """
+    
+    def __init__(self, path: Union[str, Path], ttl: float = 24 * 3600):
+        """
+        Initialize the cache
+        
+        Args:
+            path: SQLite database file, created on first use
+            ttl: Default time-to-live of entries in seconds; 0 disables the cache
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table on first use"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS content ("
+                "shortcode TEXT PRIMARY KEY, stored_at REAL NOT NULL, data BLOB NOT NULL)"
+            )
+        return self._conn
+    
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+        
+    def get(self, shortcode: str, ttl: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get cached content for a shortcode
+        
+        Args:
+            shortcode: Instagram shortcode
+            ttl: Maximum entry age in seconds, overriding the default
+            
+        Returns:
+            The cached content, or None if missing or expired
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if not self.enabled or ttl <= 0:
+            return None
+            
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT stored_at, data FROM content WHERE shortcode = ?", (shortcode,)
+            ).fetchone()
+            
+        if row is None or row[0] < time.time() - ttl:
+            return None
+        return _loads(row[1])
+        
+    def set(self, shortcode: str, content: Dict[str, Any]) -> None:
+        """Store content for a shortcode"""
+        if not self.enabled:
+            return
+            
+        data = _dumps(content)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO content (shortcode, stored_at, data) VALUES (?, ?, ?)",
+                (shortcode, time.time(), data)
+            )
+            conn.commit()
+            
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -6,24 +6,141 @@ import asyncio
 import logging
 import json
 import time
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse, parse_qs
 import re
-import requests
+
+import aiohttp
 
 try:
     import instaloader
 except ImportError:
     instaloader = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base_extractor import BaseContentExtractor
 from .scraping_infrastructure import AntiDetectionScraper, create_stealth_scraper
-from .rate_limiter import RateLimiter
+from .rate_limiter import TokenBucketRateLimiter
+from .ig_cache import DEFAULT_CACHE_PATH, InstagramCache
 
 logger = logging.getLogger(__name__)
 
+# Content URL paths accepted by validate_url (matched against the lowercased path)
+_URL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^/p/[a-zA-Z0-9_-]+/?$',  # Posts
+    r'^/reel/[a-zA-Z0-9_-]+/?$',  # Reels
+    r'^/tv/[a-zA-Z0-9_-]+/?$',  # IGTV
+    r'^/stories/[a-zA-Z0-9_.]+/[0-9]+/?$',  # Stories
+    r'^/[a-zA-Z0-9_.]+/?$'  # Profile
+))
+
+# Shortcode of post, reel and IGTV URLs
+_SHORTCODE_RE = re.compile(r'^/*(?:p|reel|tv)/([^/]+)')
+
+
+# Private-account notice, matched against raw HTTP response bytes
+_PRIVATE_ACCOUNT_RE = re.compile(rb'(?:this )?account is private', re.IGNORECASE)
+
+
+def _is_private_page(page: bytes) -> bool:
+    """Check a page for the private-account notice without decoding or lowercasing it"""
+    return _PRIVATE_ACCOUNT_RE.search(page) is not None
+
+
+def _is_rate_limited_error(error: Exception) -> bool:
+    """Check whether an extraction error was caused by HTTP 429 Too Many Requests"""
+    message = str(error).lower()
+    return '429' in message or 'too many requests' in message
+
+
+@dataclass(frozen=True, slots=True)
+class IgUrl:
+    """An Instagram URL parsed once into the parts the downloader needs"""
+    raw: str
+    netloc: str  # Lowercased
+    path: str
+    shortcode: Optional[str]
+    kind: str  # First path segment: 'p', 'reel', 'tv', 'stories' or a username
+
+
+@lru_cache(maxsize=8192)
+def _parse_ig_url(url: str) -> IgUrl:
+    """
+    Parse an Instagram URL with a single urlparse call
+    
+    Validation, shortcode extraction, directory naming and per-host limits
+    all read from this cached result, so a URL is parsed once no matter how
+    many helpers look at it.
+    """
+    parsed = urlparse(url)
+    path = parsed.path
+    match = _SHORTCODE_RE.match(path)
+    return IgUrl(
+        raw=url,
+        netloc=parsed.netloc.lower(),
+        path=path,
+        shortcode=match.group(1) if match else None,
+        kind=path.strip('/').split('/', 1)[0]
+    )
+
+
+@lru_cache(maxsize=8192)
+def _validate_ig_url(url: str) -> bool:
+    """
+    Check whether url is a supported Instagram content URL
+    
+    Cached because download_content and extract_content both validate the
+    same URL, and bulk runs and retries see repeats.
+    """
+    try:
+        ig_url = _parse_ig_url(url)
+        
+        # Check if it's an Instagram domain with an exact set lookup
+        netloc = ig_url.netloc
+        if netloc.startswith(('www.', 'm.')):
+            netloc = netloc.split('.', 1)[1]
+        if netloc not in InstagramDownloader._DOMAIN_SET:
+            return False
+        
+        # Check if it's a valid Instagram content URL
+        path = ig_url.path.lower()
+        return any(pattern.match(path) for pattern in _URL_PATTERNS)
+        
+    except Exception as e:
+        logger.error(f"Error validating Instagram URL {url}: {e}")
+        return False
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    """Format a Unix second as an ISO 8601 UTC timestamp"""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, formatted at most once per second"""
+    return _iso_timestamp(int(time.time()))
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Encode obj as indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+async def _dump_json(obj: Any, path: Path) -> None:
+    """Write obj to path as JSON in a single write, off the event loop"""
+    await asyncio.to_thread(path.write_bytes, _encode_json(obj))
+
 
 class InstagramDownloader(BaseContentExtractor):
     """
@@ -36,11 +153,46 @@ class InstagramDownloader(BaseContentExtractor):
         'm.instagram.com'
     ]
     
-    def __init__(self, download_dir: str = "downloads", rate_limit: float = 2.0):
+    # Bare domains for validation; www. and m. are stripped before lookup
+    _DOMAIN_SET = frozenset({'instagram.com'})
+    
+    # Retries with exponential backoff when Instagram answers 429
+    MAX_RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_BACKOFF = 2.0
+    
+    def __init__(self, download_dir: str = "downloads", rate_limit: float = 2.0,
+                 burst: int = 10, window: Optional[float] = None,
+                 cache_ttl: float = 24 * 3600, cache_path: Optional[str] = None):
+        """
+        Args:
+            download_dir: Base directory for downloads
+            rate_limit: Long-term average delay between requests in seconds
+            burst: Number of requests that may be sent back to back
+            window: Seconds to refill a full burst; defaults to burst * rate_limit
+            cache_ttl: Seconds extracted content stays cached; 0 disables the cache
+            cache_path: Cache database file; defaults to DEFAULT_CACHE_PATH in the user cache directory
+        """
         # Don't call super().__init__() as BaseContentExtractor has different parameters
         self.download_dir = download_dir
-        self.rate_limiter = RateLimiter(rate_limit)
+        self.rate_limiter = TokenBucketRateLimiter(
+            burst=burst,
+            window=window if window is not None else burst * rate_limit
+        )
         self.scraper = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self.cache = InstagramCache(
+            cache_path or DEFAULT_CACHE_PATH,
+            ttl=cache_ttl
+        )
+        
+        # The scraper drives a single browser page, so concurrent extractions
+        # must take turns on it
+        self._scraper_lock = asyncio.Lock()
+        self._loader_lock = asyncio.Lock()
+        
+        # Cached date string for download directories, see _get_today()
+        self._today = ""
+        self._today_expires_at = 0.0
         
         # Initialize instaloader
         if instaloader:
@@ -56,72 +208,102 @@ class InstagramDownloader(BaseContentExtractor):
             self.loader = None
             logger.warning("instaloader not available, falling back to scraping")
     
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use
+        
+        The session is kept for the downloader's lifetime so DNS lookups and
+        TCP/TLS connections are pooled across URLs; cleanup() closes it.
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=8,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                )
+            )
+        return self._http
+    
     def get_platform_domains(self) -> List[str]:
         """Return list of supported Instagram domains"""
         return self.SUPPORTED_DOMAINS
     
     def validate_url(self, url: str) -> bool:
         """Validate if URL is a supported Instagram URL"""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Check if it's an Instagram domain
-            if not any(domain.endswith(d) for d in self.SUPPORTED_DOMAINS):
-                return False
-            
-            # Check if it's a valid Instagram content URL
-            path = parsed.path.lower()
-            valid_patterns = [
-                r'^/p/[a-zA-Z0-9_-]+/?$',  # Posts
-                r'^/reel/[a-zA-Z0-9_-]+/?$',  # Reels
-                r'^/tv/[a-zA-Z0-9_-]+/?$',  # IGTV
-                r'^/stories/[a-zA-Z0-9_.]+/[0-9]+/?$',  # Stories
-                r'^/[a-zA-Z0-9_.]+/?$'  # Profile
-            ]
-            
-            return any(re.match(pattern, path) for pattern in valid_patterns)
-            
-        except Exception as e:
-            logger.error(f"Error validating Instagram URL {url}: {e}")
-            return False
+        return _validate_ig_url(url)
     
     def _extract_shortcode_from_url(self, url: str) -> Optional[str]:
         """Extract Instagram shortcode from URL"""
         try:
-            parsed = urlparse(url)
-            path = parsed.path.strip('/')
-            
-            # Extract shortcode from different URL types
-            if path.startswith(('p/', 'reel/', 'tv/')):
-                parts = path.split('/')
-                if len(parts) >= 2:
-                    return parts[1]
-            
-            return None
+            return _parse_ig_url(url).shortcode
         except Exception as e:
             logger.error(f"Error extracting shortcode from {url}: {e}")
             return None
     
+    def _get_today(self) -> str:
+        """Get today's date as YYYY-MM-DD, recomputed only after local midnight"""
+        if time.time() >= self._today_expires_at:
+            today = date.today()
+            self._today = today.isoformat()
+            next_midnight = datetime.combine(today + timedelta(days=1), dt_time.min)
+            self._today_expires_at = next_midnight.timestamp()
+        return self._today
+    
     def _get_download_directory(self, url: str) -> Path:
         """Get download directory for Instagram content"""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = self._get_today()
         shortcode = self._extract_shortcode_from_url(url) or "unknown"
         
         return Path(self.download_dir) / "instagram" / today / shortcode
     
-    async def extract_content(self, url: str) -> Dict[str, Any]:
-        """Extract content metadata from Instagram URL"""
+    async def extract_content(self, url: str, force: bool = False,
+                              ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Extract content metadata from Instagram URL
+        
+        Results are cached by shortcode, so repeat extractions within the
+        cache TTL do not touch the network.
+        
+        Args:
+            url: Instagram URL
+            force: Bypass the cache and always extract
+            ttl: Maximum age in seconds of a usable cached result, overriding the default
+        """
         if not self.validate_url(url):
             raise ValueError(f"Invalid Instagram URL: {url}")
 
-        await self.rate_limiter.wait()
+        shortcode = self._extract_shortcode_from_url(url)
+        if shortcode and not force and self.cache.enabled:
+            try:
+                cached = await asyncio.to_thread(self.cache.get, shortcode, ttl)
+            except Exception as e:
+                logger.warning(f"Instagram cache lookup failed for {shortcode}: {e}")
+                cached = None
+            if cached is not None:
+                logger.debug(f"Using cached content for {url}")
+                return {**cached, 'url': url}
+
+        content = await self._extract_uncached(url)
+
+        # Private-account and other status results are not worth caching
+        if shortcode and 'status' not in content and self.cache.enabled:
+            try:
+                await asyncio.to_thread(self.cache.set, shortcode, content)
+            except Exception as e:
+                logger.warning(f"Instagram cache store failed for {shortcode}: {e}")
 
+        return content
+    
+    async def _extract_uncached(self, url: str) -> Dict[str, Any]:
+        """Extract content metadata, trying instaloader and then scraping"""
         # Try instaloader first
         if self.loader:
             try:
                 logger.info(f"Attempting extraction with instaloader for {url}")
-                return await self._extract_with_instaloader(url)
+                return await self._rate_limited(self._extract_with_instaloader, url)
             except Exception as e:
                 logger.warning(f"Instaloader failed for {url}: {e}. Falling back to scraping...")
                 # Fall through to scraping method
@@ -129,11 +311,26 @@ class InstagramDownloader(BaseContentExtractor):
         # Fallback to scraping
         try:
             logger.info(f"Attempting extraction with scraping for {url}")
-            return await self._extract_with_scraping(url)
+            return await self._rate_limited(self._extract_with_scraping, url)
         except Exception as e:
             logger.error(f"Both extraction methods failed for {url}: {e}")
             raise
     
+    async def _rate_limited(self, extract: Callable[[str], Awaitable[Dict[str, Any]]],
+                            url: str) -> Dict[str, Any]:
+        """Run an extraction under the rate limiter, backing off and retrying on HTTP 429"""
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            async with self.rate_limiter:
+                try:
+                    return await extract(url)
+                except Exception as e:
+                    if attempt >= self.MAX_RATE_LIMIT_RETRIES or not _is_rate_limited_error(e):
+                        raise
+            
+            delay = self.RATE_LIMIT_BACKOFF * 2 ** attempt
+            logger.warning(f"Rate limited while extracting {url}, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+    
     async def _extract_with_instaloader(self, url: str) -> Dict[str, Any]:
         """Extract content using instaloader library"""
         shortcode = self._extract_shortcode_from_url(url)
@@ -141,28 +338,9 @@ class InstagramDownloader(BaseContentExtractor):
             raise ValueError(f"Could not extract shortcode from URL: {url}")
 
         try:
-            # Get post from shortcode
-            post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
-
-            return {
-                'url': url,
-                'shortcode': shortcode,
-                'title': post.caption or "",
-                'description': post.caption or "",
-                'author': post.owner_username,
-                'upload_date': post.date_utc.isoformat() if post.date_utc else None,
-                'view_count': post.video_view_count if post.is_video else None,
-                'like_count': post.likes,
-                'comment_count': post.comments,
-                'is_video': post.is_video,
-                'duration': post.video_duration if post.is_video else None,
-                'thumbnail_url': post.url,
-                'media_urls': [post.video_url] if post.is_video else [post.url],
-                'hashtags': post.caption_hashtags,
-                'mentions': post.caption_mentions,
-                'location': post.location.name if post.location else None,
-                'extracted_at': datetime.now().isoformat()
-            }
+            # instaloader is synchronous and fetches post metadata lazily, so
+            # both the lookup and the field reads run in a worker thread
+            return await asyncio.to_thread(self._fetch_post_info, url, shortcode)
         except Exception as e:
             error_msg = str(e).lower()
             # Check for private account indicators
@@ -179,8 +357,38 @@ class InstagramDownloader(BaseContentExtractor):
                 logger.error(f"Error extracting with instaloader: {e}")
                 raise
     
+    def _fetch_post_info(self, url: str, shortcode: str) -> Dict[str, Any]:
+        """Fetch post metadata with instaloader (blocking)"""
+        # Get post from shortcode
+        post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
+
+        return {
+            'url': url,
+            'shortcode': shortcode,
+            'title': post.caption or "",
+            'description': post.caption or "",
+            'author': post.owner_username,
+            'upload_date': post.date_utc.isoformat() if post.date_utc else None,
+            'view_count': post.video_view_count if post.is_video else None,
+            'like_count': post.likes,
+            'comment_count': post.comments,
+            'is_video': post.is_video,
+            'duration': post.video_duration if post.is_video else None,
+            'thumbnail_url': post.url,
+            'media_urls': [post.video_url] if post.is_video else [post.url],
+            'hashtags': post.caption_hashtags,
+            'mentions': post.caption_mentions,
+            'location': post.location.name if post.location else None,
+            'extracted_at': _now_iso()
+        }
+    
     async def _extract_with_scraping(self, url: str) -> Dict[str, Any]:
         """Extract content using web scraping as fallback"""
+        async with self._scraper_lock:
+            return await self._scrape_content(url)
+    
+    async def _scrape_content(self, url: str) -> Dict[str, Any]:
+        """Scrape content metadata; callers must hold the scraper lock"""
         if not self.scraper:
             try:
                 self.scraper = await create_stealth_scraper()
@@ -188,14 +396,16 @@ class InstagramDownloader(BaseContentExtractor):
                 # If Chrome setup fails, check if this might be a private account
                 # by doing a simple HTTP request first
                 try:
-                    response = requests.get(url, timeout=10)
-                    if 'This account is private' in response.text or 'private' in response.text.lower():
+                    http = await self._get_http()
+                    async with http.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        page_bytes = await response.read()
+                    if _is_private_page(page_bytes):
                         return {
                             'url': url,
                             'shortcode': self._extract_shortcode_from_url(url),
                             'status': 'private_account',
                             'error': 'The account is private, cannot extract the data',
-                            'extracted_at': datetime.now().isoformat(),
+                            'extracted_at': _now_iso(),
                             'extraction_method': 'http_check'
                         }
                 except:
@@ -207,22 +417,25 @@ class InstagramDownloader(BaseContentExtractor):
             await self.scraper.navigate_to(url)
             await asyncio.sleep(2)  # Wait for content to load
 
-            # Check for private account message
-            page_text = await self.scraper.get_page_source()
-            if 'This account is private' in page_text or 'account is private' in page_text.lower():
+            # The private-account check and the meta reads are independent
+            # browser queries, so issue them together instead of back to back
+            is_private, meta = await asyncio.gather(
+                self.scraper.page_contains_text('account is private'),
+                self.scraper.get_meta_batch(['og:title', 'og:description', 'og:image'])
+            )
+            if is_private:
                 return {
                     'url': url,
                     'shortcode': self._extract_shortcode_from_url(url),
                     'status': 'private_account', 
                     'error': 'The account is private, cannot extract the data',
-                    'extracted_at': datetime.now().isoformat(),
+                    'extracted_at': _now_iso(),
                     'extraction_method': 'scraping'
                 }
 
-            # Extract basic metadata from page
-            title = await self.scraper.get_text('meta[property="og:title"]', attribute='content')
-            description = await self.scraper.get_text('meta[property="og:description"]', attribute='content')
-            image_url = await self.scraper.get_text('meta[property="og:image"]', attribute='content')
+            title = meta.get('og:title')
+            description = meta.get('og:description')
+            image_url = meta.get('og:image')
 
             return {
                 'url': url,
@@ -230,7 +443,7 @@ class InstagramDownloader(BaseContentExtractor):
                 'title': title or "",
                 'description': description or "",
                 'thumbnail_url': image_url,
-                'extracted_at': datetime.now().isoformat(),
+                'extracted_at': _now_iso(),
                 'extraction_method': 'scraping'
             }
         except Exception as e:
@@ -280,27 +493,30 @@ class InstagramDownloader(BaseContentExtractor):
         shortcode = content_info['shortcode']
         
         try:
-            # Set download directory
-            original_dir = self.loader.dirname_pattern
-            self.loader.dirname_pattern = str(target_dir)
-            
-            # Download post
-            post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
-            self.loader.download_post(post, target="")
-            
-            # Restore original directory pattern
-            self.loader.dirname_pattern = original_dir
+            # The loader's directory pattern is shared state, so concurrent
+            # downloads take turns to set it, download and restore it
+            async with self._loader_lock:
+                original_dir = self.loader.dirname_pattern
+                self.loader.dirname_pattern = str(target_dir)
+                try:
+                    # Download post off the event loop
+                    post = await asyncio.to_thread(instaloader.Post.from_shortcode, self.loader.context, shortcode)
+                    await asyncio.to_thread(self.loader.download_post, post, target="")
+                finally:
+                    # Restore original directory pattern
+                    self.loader.dirname_pattern = original_dir
             
             # Create metadata file
-            metadata_file = target_dir / "metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(content_info, f, indent=2, ensure_ascii=False)
+            await _dump_json(content_info, target_dir / "metadata.json")
             
             return {
                 **content_info,
                 'download_status': 'success',
                 'download_path': str(target_dir),
-                'files_downloaded': list(target_dir.glob('*'))
+                'files_downloaded': [
+                    entry.name for entry in target_dir.iterdir()
+                    if entry.is_file() and entry.name != "metadata.json"
+                ]
             }
             
         except Exception as e:
@@ -314,9 +530,7 @@ class InstagramDownloader(BaseContentExtractor):
     async def _download_with_scraping(self, content_info: Dict[str, Any], target_dir: Path) -> Dict[str, Any]:
         """Download content using web scraping"""
         # For now, just save metadata - actual media download would require more complex scraping
-        metadata_file = target_dir / "metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(content_info, f, indent=2, ensure_ascii=False)
+        await _dump_json(content_info, target_dir / "metadata.json")
         
         return {
             **content_info,
@@ -325,32 +539,92 @@ class InstagramDownloader(BaseContentExtractor):
             'note': 'Full media download requires instaloader library'
         }
     
-    async def extract_bulk_content(self, urls: List[str]) -> List[Dict[str, Any]]:
-        """Extract content from multiple Instagram URLs"""
-        results = []
+    def _bounded_extractor(self, concurrency: int,
+                           per_host_limit: int) -> Callable[[str], Awaitable[Dict[str, Any]]]:
+        """
+        Build a coroutine function that extracts one URL within concurrency limits
+        
+        Failures are returned as result dicts instead of raised, so one bad
+        URL never aborts a bulk run.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
         
-        for url in urls:
+        async def _extract_one(url: str) -> Dict[str, Any]:
             try:
-                result = await self.extract_content(url)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error processing URL {url}: {e}")
-                results.append({
-                    'url': url,
-                    'error': str(e),
-                    'status': 'failed'
-                })
+                host = _parse_ig_url(url).netloc
+            except ValueError:
+                host = ""
+            host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(per_host_limit))
+            
+            # The shared rate limiter inside extract_content still governs the
+            # overall request budget; the semaphores only bound in-flight work
+            async with semaphore, host_semaphore:
+                try:
+                    return await self.extract_content(url)
+                except Exception as e:
+                    logger.error(f"Error processing URL {url}: {e}")
+                    return {
+                        'url': url,
+                        'error': str(e),
+                        'status': 'failed'
+                    }
+        
+        return _extract_one
+    
+    async def iter_bulk_content(self, urls: List[str], concurrency: int = 8,
+                                per_host_limit: int = 4) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Extract content from multiple Instagram URLs, yielding results as they complete
         
-        return results
+        Unlike extract_bulk_content, results are not accumulated, so callers
+        can stream them to storage with constant memory. Results arrive in
+        completion order; each one carries its 'url'.
+        
+        Args:
+            urls: URLs to extract
+            concurrency: Maximum number of extractions in flight
+            per_host_limit: Maximum number of extractions in flight per host
+        """
+        extract_one = self._bounded_extractor(concurrency, per_host_limit)
+        tasks = [asyncio.ensure_future(extract_one(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding work if the consumer exits early
+            for task in tasks:
+                task.cancel()
+    
+    async def extract_bulk_content(self, urls: List[str], concurrency: int = 8,
+                                   per_host_limit: int = 4) -> List[Dict[str, Any]]:
+        """
+        Extract content from multiple Instagram URLs concurrently
+        
+        Args:
+            urls: URLs to extract
+            concurrency: Maximum number of extractions in flight
+            per_host_limit: Maximum number of extractions in flight per host
+            
+        Returns:
+            Results in the same order as urls; failures are reported inline
+        """
+        extract_one = self._bounded_extractor(concurrency, per_host_limit)
+        return list(await asyncio.gather(*(extract_one(url) for url in urls)))
     
     async def cleanup(self):
         """Clean up resources"""
         if self.scraper:
             await self.scraper.cleanup()
             self.scraper = None
+        if self._http:
+            await self._http.close()
+            self._http = None
+        self.cache.close()
 
 
 # Utility function for easy access
-def create_instagram_downloader(download_dir: str = "downloads", rate_limit: float = 2.0) -> InstagramDownloader:
+def create_instagram_downloader(download_dir: str = "downloads", rate_limit: float = 2.0,
+                                burst: int = 10, window: Optional[float] = None) -> InstagramDownloader:
     """Create an Instagram downloader instance"""
-    return InstagramDownloader(download_dir, rate_limit)
+    return InstagramDownloader(download_dir, rate_limit, burst=burst, window=window)
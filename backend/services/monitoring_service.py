@@ -4,11 +4,19 @@ Handles automated monitoring of social media channels/accounts
 """
 
 import uuid
+import heapq
+import time
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable, ClassVar, Iterator, List, Dict, Any, Optional, Tuple, Union
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, or_, func, case, insert, lambda_stmt, literal, select, update
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from backend.db.models import (
     MonitoringJob, 
@@ -22,22 +30,228 @@ from backend.services.youtube_downloader import YouTubeDownloader
 from backend.services.instagram_downloader import InstagramDownloader
 from backend.services.threads_downloader import ThreadsDownloader
 from backend.services.rednote_downloader import RedNoteDownloader
+from backend.services.notification_dispatcher import notification_dispatcher
+from backend.core.config import settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fixed scheduling intervals; CUSTOM uses the job's interval_minutes
+_FREQUENCY_DELTAS = {
+    MonitoringFrequency.HOURLY: timedelta(hours=1),
+    MonitoringFrequency.DAILY: timedelta(days=1),
+    MonitoringFrequency.WEEKLY: timedelta(weeks=1),
+    MonitoringFrequency.MONTHLY: timedelta(days=30),  # Approximate a month as 30 days
+}
+
+
+def _epoch(moment: datetime) -> float:
+    """Unix time for a datetime, treating naive values (as SQLite returns) as UTC"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class _DueJobIndex:
+    """
+    In-process min-heap of (next_run_at, job id) for active jobs
+    
+    Lets the scheduler answer "is anything due?" without a database round
+    trip. Entries are invalidated lazily: a job's current due time lives in
+    _due, and heap entries that no longer match it are skipped when they
+    reach the top. The database remains the source of truth; the index is
+    rebuilt from it every RESYNC_INTERVAL seconds to pick up changes made
+    by other processes.
+    """
+    
+    # Every path that schedules a job puts its next run at least one minute
+    # out (the shortest CUSTOM interval). Resyncing at half that, rather than
+    # at exactly that boundary, means a change made by another process is
+    # indexed before it comes due.
+    RESYNC_INTERVAL = 30.0
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, int]] = []
+        self._due: Dict[int, float] = {}
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._resync_lock = threading.Lock()
+    
+    def needs_resync(self) -> bool:
+        """Whether the index is unseeded or older than RESYNC_INTERVAL"""
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.RESYNC_INTERVAL
+    
+    def resync_if_stale(self, fetch: Callable[[], List[Tuple[int, datetime]]]) -> None:
+        """
+        Rebuild the index from fetch() if it is stale, one caller at a time
+        
+        Concurrent callers share a single scan: whoever gets the lock runs
+        it, and the rest find the index fresh once they get in and skip
+        theirs, riding on the pass that was already under way.
+        """
+        if not self.needs_resync():
+            return
+        with self._resync_lock:
+            if self.needs_resync():
+                self.resync(fetch())
+    
+    def resync(self, rows: List[Tuple[int, datetime]]) -> None:
+        """Rebuild the index from (job id, next_run_at) rows"""
+        due = {job_id: _epoch(next_run_at) for job_id, next_run_at in rows if next_run_at is not None}
+        heap = [(when, job_id) for job_id, when in due.items()]
+        heapq.heapify(heap)
+        with self._lock:
+            self._heap, self._due = heap, due
+            self._synced_at = time.monotonic()
+    
+    def invalidate(self) -> None:
+        """Force a rebuild on the next check"""
+        with self._lock:
+            self._synced_at = None
+    
+    def schedule(self, job_id: int, next_run_at: Optional[datetime]) -> None:
+        """Record a job's new due time"""
+        if next_run_at is None:
+            self.discard(job_id)
+            return
+        when = _epoch(next_run_at)
+        with self._lock:
+            self._due[job_id] = when
+            heapq.heappush(self._heap, (when, job_id))
+    
+    def discard(self, job_id: int) -> None:
+        """Stop tracking a job; its heap entries become stale"""
+        with self._lock:
+            self._due.pop(job_id, None)
+    
+    def has_due(self, now: datetime) -> bool:
+        """Whether any tracked job is due at now"""
+        cutoff = _epoch(now)
+        with self._lock:
+            heap = self._heap
+            while heap:
+                when, job_id = heap[0]
+                if self._due.get(job_id) != when:
+                    heapq.heappop(heap)  # Superseded or discarded entry
+                    continue
+                return when <= cutoff
+            return False
+
+
+# Shared by every MonitoringService in the process
+_due_jobs = _DueJobIndex()
+
+
+class DownloaderRegistry:
+    """
+    Process-wide downloaders, one fixed slot per platform
+    
+    Each downloader is created on first request. Lookup is an identity
+    check on the platform enum followed by a slot read, with no hashing.
+    Slot names match the PlatformType values.
+    """
+    
+    __slots__ = ('youtube', 'instagram', 'threads', 'rednote', '_classes', '_lock')
+    
+    def __init__(self, classes: Dict[PlatformType, type]):
+        """
+        Initialize the registry
+        
+        Args:
+            classes: Downloader class for each platform
+        """
+        self.youtube = None
+        self.instagram = None
+        self.threads = None
+        self.rednote = None
+        self._classes = classes
+        self._lock = threading.Lock()
+    
+    def get(self, platform: PlatformType) -> Optional[Any]:
+        """Get the downloader for a platform, creating it on first use"""
+        if platform is PlatformType.YOUTUBE:
+            downloader = self.youtube
+        elif platform is PlatformType.INSTAGRAM:
+            downloader = self.instagram
+        elif platform is PlatformType.THREADS:
+            downloader = self.threads
+        elif platform is PlatformType.REDNOTE:
+            downloader = self.rednote
+        else:
+            return None
+        
+        if downloader is None:
+            downloader = self._create(platform)
+        return downloader
+    
+    def _create(self, platform: PlatformType) -> Optional[Any]:
+        """Instantiate a platform's downloader once, even under concurrent first use"""
+        downloader_class = self._classes.get(platform)
+        if downloader_class is None:
+            return None
+        
+        with self._lock:
+            downloader = getattr(self, platform.value)
+            if downloader is None:
+                downloader = downloader_class()
+                setattr(self, platform.value, downloader)
+        return downloader
+
 
 class MonitoringService:
     """Service for managing automated monitoring of social media channels/accounts"""
     
+    # Downloader method for each monitoring target type
+    TARGET_METHODS = {
+        'channel': 'download_channel',
+        'account': 'download_account',
+        'hashtag': 'download_hashtag'
+    }
+    
+    # Columns loaded for job listings that don't need the JSON option blobs
+    SUMMARY_COLUMNS = (
+        MonitoringJob.id,
+        MonitoringJob.job_id,
+        MonitoringJob.name,
+        MonitoringJob.status,
+        MonitoringJob.platform,
+        MonitoringJob.next_run_at
+    )
+    
+    # A RUNNING job claimed this long ago is treated as abandoned by a
+    # crashed worker and can be claimed again. Claiming stamps the claim time
+    # into next_run_at, so staleness is measured from the claim rather than
+    # from when the job originally came due.
+    STALE_CLAIM_AFTER = timedelta(hours=1)
+    
+    # Downloader class per platform, instantiated on first use by _downloader_for
+    DOWNLOADER_CLASSES = {
+        PlatformType.YOUTUBE: YouTubeDownloader,
+        PlatformType.INSTAGRAM: InstagramDownloader,
+        PlatformType.THREADS: ThreadsDownloader,
+        PlatformType.REDNOTE: RedNoteDownloader
+    }
+    _registry: ClassVar["DownloaderRegistry"] = DownloaderRegistry(DOWNLOADER_CLASSES)
+    
+    __slots__ = ('db',)
+    
     def __init__(self, db: Session):
         self.db = db
-        self.downloaders = {
-            PlatformType.YOUTUBE: YouTubeDownloader(),
-            PlatformType.INSTAGRAM: InstagramDownloader(),
-            PlatformType.THREADS: ThreadsDownloader(),
-            PlatformType.REDNOTE: RedNoteDownloader()
-        }
+    
+    @classmethod
+    def _downloader_for(cls, platform: PlatformType) -> Optional[Any]:
+        """
+        Get the shared downloader for a platform
+        
+        Downloaders are created once per process and reused by every service
+        instance, so constructing a service per request stays cheap.
+        """
+        return cls._registry.get(platform)
+    
+    @classmethod
+    def reset_downloaders(cls) -> None:
+        """Drop the shared downloader instances (mainly for tests)"""
+        cls._registry = DownloaderRegistry(cls.DOWNLOADER_CLASSES)
     
     def create_monitoring_job(self, job_data: Dict[str, Any]) -> MonitoringJob:
         """
@@ -83,6 +297,7 @@ class MonitoringService:
         self.db.add(monitoring_job)
         self.db.commit()
         self.db.refresh(monitoring_job)
+        self._index_job(monitoring_job)
         
         logger.info(f"Created monitoring job: {monitoring_job.job_id} ({monitoring_job.name})")
         return monitoring_job
@@ -103,9 +318,10 @@ class MonitoringService:
             logger.warning(f"Monitoring job not found: {job_id}")
             return None
         
-        # Update fields
+        # Update fields, leaving unchanged ones alone so they are not
+        # marked dirty and re-serialized
         for key, value in job_data.items():
-            if hasattr(job, key) and key != 'id' and key != 'job_id':
+            if hasattr(job, key) and key != 'id' and key != 'job_id' and getattr(job, key) != value:
                 setattr(job, key, value)
         
         # If frequency was updated, recalculate next run time
@@ -117,6 +333,7 @@ class MonitoringService:
         
         self.db.commit()
         self.db.refresh(job)
+        self._index_job(job)
         
         logger.info(f"Updated monitoring job: {job.job_id} ({job.name})")
         return job
@@ -136,12 +353,10 @@ class MonitoringService:
             logger.warning(f"Monitoring job not found: {job_id}")
             return False
         
-        # Delete all associated runs
-        self.db.query(MonitoringRun).filter(MonitoringRun.monitoring_job_id == job_id).delete()
-        
-        # Delete the job
+        # Delete the job; its runs go with it through ON DELETE CASCADE
         self.db.delete(job)
         self.db.commit()
+        _due_jobs.discard(job_id)
         
         logger.info(f"Deleted monitoring job: {job.job_id} ({job.name})")
         return True
@@ -179,160 +394,608 @@ class MonitoringService:
         Returns:
             List of MonitoringJob instances
         """
-        query = self.db.query(MonitoringJob)
+        stmt = self._filtered_jobs_stmt(lambda_stmt(lambda: select(MonitoringJob)), user_id, platform, status)
+        
+        # Apply pagination
+        stmt += lambda s: s.offset(skip).limit(limit)
         
-        # Apply filters
+        return self.db.execute(stmt).scalars().all()
+    
+    def get_monitoring_jobs_page(
+        self, 
+        user_id: Optional[int] = None, 
+        platform: Optional[PlatformType] = None,
+        status: Optional[MonitoringStatus] = None,
+        skip: int = 0, 
+        limit: int = 100,
+        summary_only: bool = False
+    ) -> Tuple[List[MonitoringJob], int]:
+        """
+        Get a page of monitoring jobs together with the total match count
+        
+        Args:
+            user_id: Filter by user ID
+            platform: Filter by platform
+            status: Filter by status
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            summary_only: Load only the SUMMARY_COLUMNS, skipping the JSON
+                option blobs; other attributes load lazily if touched
+            
+        Returns:
+            Tuple of (MonitoringJob instances, total number of matching jobs)
+        """
+        count_stmt = self._filtered_jobs_stmt(
+            lambda_stmt(lambda: select(func.count(MonitoringJob.id))), user_id, platform, status
+        )
+        total = self.db.execute(count_stmt).scalar()
+        if total <= skip:
+            return [], total
+        
+        stmt = self._filtered_jobs_stmt(lambda_stmt(lambda: select(MonitoringJob)), user_id, platform, status)
+        if summary_only:
+            stmt += lambda s: s.options(load_only(*MonitoringService.SUMMARY_COLUMNS))
+        stmt += lambda s: s.order_by(MonitoringJob.id).offset(skip).limit(limit)
+        items = self.db.execute(stmt).scalars().all()
+        
+        return items, total
+    
+    @staticmethod
+    def _filtered_jobs_stmt(
+        stmt: StatementLambdaElement, 
+        user_id: Optional[int], 
+        platform: Optional[PlatformType],
+        status: Optional[MonitoringStatus]
+    ) -> StatementLambdaElement:
+        """
+        Add the monitoring job filters to a lambda statement
+        
+        SQLAlchemy caches the SQL construct per combination of filters that
+        fire; the filter values become bound parameters.
+        """
         if user_id is not None:
-            query = query.filter(MonitoringJob.user_id == user_id)
+            stmt += lambda s: s.where(MonitoringJob.user_id == user_id)
         if platform is not None:
-            query = query.filter(MonitoringJob.platform == platform)
+            stmt += lambda s: s.where(MonitoringJob.platform == platform)
         if status is not None:
-            query = query.filter(MonitoringJob.status == status)
+            stmt += lambda s: s.where(MonitoringJob.status == status)
         
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        return query.all()
+        return stmt
     
-    def get_pending_jobs(self) -> List[MonitoringJob]:
+    def get_pending_jobs(self, limit: Optional[int] = None) -> List[MonitoringJob]:
         """
         Get all jobs that are due to run
         
+        Always queries the database rather than trusting this process's
+        due-job index, so API and diagnostic callers see jobs scheduled by
+        other processes immediately.
+        
+        Args:
+            limit: Maximum number of jobs to return, earliest due first
+        
         Returns:
             List of MonitoringJob instances
         """
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         
         # Use a simpler query that doesn't rely on User model relationships
         # This avoids potential circular import issues
-        return self.db.query(MonitoringJob).filter(
+        stmt = select(MonitoringJob).where(
             and_(
                 MonitoringJob.status == MonitoringStatus.ACTIVE,
                 MonitoringJob.next_run_at <= now
             )
+        ).order_by(MonitoringJob.next_run_at)
+        if limit:
+            stmt = stmt.limit(limit)
+        
+        return self.db.execute(stmt).scalars().all()
+    
+    def claim_pending_jobs(self, batch_size: Optional[int] = None) -> List[MonitoringJob]:
+        """
+        Claim due jobs for this worker by marking them RUNNING
+        
+        Rows are selected FOR UPDATE SKIP LOCKED (ignored on SQLite) and
+        flipped to RUNNING in the same transaction, so concurrent scheduler
+        processes never pick up the same job. The same UPDATE sets
+        next_run_at to the claim time, which is what STALE_CLAIM_AFTER is
+        measured from; finishing the run schedules the next one. The scan is
+        served by the (status, next_run_at) index.
+        
+        Args:
+            batch_size: Maximum number of jobs to claim, earliest due first
+        
+        Returns:
+            List of claimed MonitoringJob instances
+        """
+        now = datetime.now(timezone.utc)
+        if not self._any_job_due(now):
+            return []
+        
+        stmt = select(MonitoringJob).where(
+            or_(
+                and_(
+                    MonitoringJob.status == MonitoringStatus.ACTIVE,
+                    MonitoringJob.next_run_at <= now
+                ),
+                and_(
+                    MonitoringJob.status == MonitoringStatus.RUNNING,
+                    MonitoringJob.next_run_at <= now - self.STALE_CLAIM_AFTER
+                )
+            )
+        ).order_by(MonitoringJob.next_run_at).with_for_update(skip_locked=True)
+        if batch_size:
+            stmt = stmt.limit(batch_size)
+        
+        jobs = self.db.execute(stmt).scalars().all()
+        if not jobs:
+            self.db.commit()
+            return []
+        
+        job_ids = [job.id for job in jobs]
+        # The bulk UPDATE also applies the new values to the loaded jobs
+        self.db.execute(
+            update(MonitoringJob)
+            .where(MonitoringJob.id.in_(job_ids))
+            .values(status=MonitoringStatus.RUNNING, next_run_at=now)
+        )
+        self.db.commit()
+        
+        # Claimed jobs only come due again if their claim goes stale
+        for job_id in job_ids:
+            _due_jobs.schedule(job_id, now + self.STALE_CLAIM_AFTER)
+        
+        return jobs
+    
+    @classmethod
+    def invalidate_schedule(cls) -> None:
+        """Rebuild the in-process due-job index from the database on next use"""
+        _due_jobs.invalidate()
+    
+    def _any_job_due(self, now: datetime) -> bool:
+        """
+        Check the in-process index for due jobs, resyncing it if stale
+        
+        A False answer lets the scheduler skip the pending-jobs query.
+        Claimed (RUNNING) jobs stay indexed, due when their claim goes
+        stale, so abandoned claims are still found.
+        """
+        _due_jobs.resync_if_stale(self._fetch_schedule)
+        return _due_jobs.has_due(now)
+    
+    def _fetch_schedule(self) -> List[Tuple[int, datetime]]:
+        """Load (job id, due time) for every job the scheduler may claim"""
+        rows = self.db.execute(
+            select(MonitoringJob.id, MonitoringJob.next_run_at, MonitoringJob.status).where(
+                MonitoringJob.status.in_([MonitoringStatus.ACTIVE, MonitoringStatus.RUNNING])
+            )
         ).all()
+        return [
+            (job_id, next_run_at + self.STALE_CLAIM_AFTER
+             if status is MonitoringStatus.RUNNING and next_run_at is not None else next_run_at)
+            for job_id, next_run_at, status in rows
+        ]
+    
+    def _index_job(self, job: MonitoringJob) -> None:
+        """Mirror a job's schedule into the in-process due-job index"""
+        if job.status is MonitoringStatus.ACTIVE:
+            _due_jobs.schedule(job.id, job.next_run_at)
+        else:
+            _due_jobs.discard(job.id)
     
-    def execute_job(self, job_id: int) -> MonitoringRun:
+    def execute_job(self, job_id: Union[int, MonitoringJob]) -> MonitoringRun:
         """
         Execute a monitoring job immediately
         
         Args:
-            job_id: ID of the job to execute
+            job_id: ID of the job to execute, or the already loaded job
             
         Returns:
             The MonitoringRun instance
         """
-        job = self.get_monitoring_job(job_id)
-        if not job:
-            raise ValueError(f"Monitoring job not found: {job_id}")
+        with self._keep_loaded_on_commit():
+            job, run = self._start_run(job_id)
+            
+            try:
+                outcome = self._prepare_download(job)()
+            except Exception as e:
+                outcome = e
+            
+            now = datetime.now(timezone.utc)
+            succeeded = self._apply_outcome(job, run, outcome, now)
+            self._update_job_stats([(job, succeeded)], now)
+            
+            # Commit changes
+            self.db.commit()
+        
+        return run
+    
+    @contextmanager
+    def _keep_loaded_on_commit(self) -> Iterator[None]:
+        """
+        Keep loaded objects' attributes across commits made inside the block
         
-        # Create a new monitoring run
+        Running a job commits several times while it goes on using the job
+        and run it already holds, which would otherwise re-SELECT both after
+        every commit. The session's own setting is restored afterwards, so
+        other callers still see expire-on-commit.
+        """
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            yield
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+    
+    def _start_run(self, job_id: Union[int, MonitoringJob]) -> Tuple[MonitoringJob, MonitoringRun]:
+        """Look up a job, unless already given one, and record a new in-progress run for it"""
+        if isinstance(job_id, MonitoringJob):
+            job = job_id
+        else:
+            job = self.get_monitoring_job(job_id)
+            if not job:
+                raise ValueError(f"Monitoring job not found: {job_id}")
+        
+        # Create a new monitoring run. start_time is set here rather than by
+        # the server default so the run needs no reload after commit. The
+        # run is committed, not just flushed, so it shows as in progress and
+        # no write transaction stays open during the download.
         run = MonitoringRun(
             monitoring_job_id=job.id,
-            status=DownloadStatus.IN_PROGRESS
+            status=DownloadStatus.IN_PROGRESS,
+            start_time=datetime.now(timezone.utc)
         )
         self.db.add(run)
         self.db.commit()
-        self.db.refresh(run)
         
-        try:
-            # Get the appropriate downloader
-            downloader = self.downloaders.get(job.platform)
-            if not downloader:
-                raise ValueError(f"No downloader available for platform: {job.platform}")
-            
-            # Execute the download based on target type
-            if job.target_type == 'channel':
-                result = downloader.download_channel(
-                    job.target_url, 
-                    max_items=job.max_items_per_run,
-                    options=job.download_options or {}
-                )
-            elif job.target_type == 'account':
-                result = downloader.download_account(
-                    job.target_url,
-                    max_items=job.max_items_per_run,
-                    options=job.download_options or {}
-                )
-            elif job.target_type == 'hashtag':
-                result = downloader.download_hashtag(
-                    job.target_url,
-                    max_items=job.max_items_per_run,
-                    options=job.download_options or {}
-                )
-            else:
-                raise ValueError(f"Unsupported target type: {job.target_type}")
-            
-            # Update the monitoring run with results
-            run.items_found = result.get('items_found', 0)
-            run.items_processed = result.get('items_processed', 0)
-            run.new_items_downloaded = result.get('new_items', 0)
-            run.download_job_id = result.get('download_job_id')
-            run.status = DownloadStatus.COMPLETED
-            run.end_time = datetime.utcnow()
-            
-            # Update the job's statistics
-            job.last_run_at = datetime.utcnow()
-            job.next_run_at = self._calculate_next_run_time(job.frequency, job.interval_minutes)
-            job.total_runs += 1
-            job.successful_runs += 1
-            
-            # Handle notifications if new content was found
-            if run.new_items_downloaded > 0 and job.notify_on_new_content:
-                self._send_notification(
-                    job,
-                    f"New content detected: {run.new_items_downloaded} new items from {job.name}"
-                )
-            
-            logger.info(f"Monitoring job executed successfully: {job.job_id} ({job.name})")
+        return job, run
+    
+    def _prepare_download(self, job: MonitoringJob) -> Callable[[], Dict[str, Any]]:
+        """
+        Bind the platform downloader call for a job's target
+        
+        Job attributes are read here, on the caller's thread, so the returned
+        callable can run in a worker thread without touching the session.
+        """
+        # Get the appropriate downloader
+        downloader = self._downloader_for(job.platform)
+        if not downloader:
+            raise ValueError(f"No downloader available for platform: {job.platform}")
+        
+        # Pick the download method based on target type
+        method_name = self.TARGET_METHODS.get(job.target_type)
+        if not method_name:
+            raise ValueError(f"Unsupported target type: {job.target_type}")
+        
+        return partial(
+            getattr(downloader, method_name),
+            job.target_url,
+            max_items=job.max_items_per_run,
+            options=job.download_options or {}
+        )
+    
+    def _apply_outcome(
+        self, 
+        job: MonitoringJob, 
+        run: MonitoringRun, 
+        outcome: Union[Dict[str, Any], BaseException],
+        now: datetime
+    ) -> bool:
+        """
+        Record a download outcome on an existing run
+        
+        Job statistics are left to _update_job_stats so callers can write
+        them for many jobs at once. Nothing is committed here.
+        
+        Args:
+            job: The monitoring job that was executed
+            run: The run to update
+            outcome: The downloader result, or the exception it raised
+            now: When the download finished
             
-        except Exception as e:
-            # Handle failure
-            logger.exception(f"Error executing monitoring job {job.job_id}: {str(e)}")
+        Returns:
+            True if the download succeeded
+        """
+        values, succeeded = self._outcome_values(job, outcome, now)
+        for key, value in values.items():
+            setattr(run, key, value)
+        return succeeded
+    
+    def _outcome_values(
+        self, 
+        job: MonitoringJob, 
+        outcome: Union[Dict[str, Any], BaseException],
+        now: datetime
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Compute run column values for a download outcome and send any notifications
+        
+        Every outcome yields the same set of keys, so a batch of runs
+        updates the same columns and its UPDATEs can be sent together.
+        
+        Args:
+            job: The monitoring job that was executed
+            outcome: The downloader result, or the exception it raised
+            now: When the download finished
             
-            run.status = DownloadStatus.FAILED
-            run.end_time = datetime.utcnow()
-            run.error_message = str(e)
+        Returns:
+            Tuple of (MonitoringRun column values, whether the download succeeded)
+        """
+        values = {
+            'end_time': now,
+            'items_found': 0,
+            'items_processed': 0,
+            'new_items_downloaded': 0,
+            'download_job_id': None,
+            'error_message': None
+        }
+        
+        # BaseException too: gather(return_exceptions=True) can hand back a
+        # CancelledError, which is not an Exception
+        if isinstance(outcome, BaseException):
+            logger.error(f"Error executing monitoring job {job.job_id}: {str(outcome)}", exc_info=outcome)
             
-            # Update the job's statistics
-            job.last_run_at = datetime.utcnow()
-            job.next_run_at = self._calculate_next_run_time(job.frequency, job.interval_minutes)
-            job.total_runs += 1
-            job.failed_runs += 1
+            values['status'] = DownloadStatus.FAILED
+            values['error_message'] = str(outcome)
             
             # Handle failure notification
             if job.notify_on_failure:
                 self._send_notification(
                     job,
                     f"Monitoring job failed: {job.name}",
-                    error=str(e)
+                    error=str(outcome)
                 )
+            return values, False
         
-        # Commit changes
-        self.db.commit()
-        self.db.refresh(run)
+        # Update the monitoring run with results
+        values['items_found'] = outcome.get('items_found', 0)
+        values['items_processed'] = outcome.get('items_processed', 0)
+        values['new_items_downloaded'] = outcome.get('new_items', 0)
+        values['download_job_id'] = outcome.get('download_job_id')
+        values['status'] = DownloadStatus.COMPLETED
         
-        return run
+        # Handle notifications if new content was found
+        if values['new_items_downloaded'] > 0 and job.notify_on_new_content:
+            self._send_notification(
+                job,
+                f"New content detected: {values['new_items_downloaded']} new items from {job.name}"
+            )
+        
+        logger.info(f"Monitoring job executed successfully: {job.job_id} ({job.name})")
+        return values, True
+    
+    def _update_job_stats(
+        self, 
+        outcomes: List[Tuple[MonitoringJob, bool]], 
+        now: datetime,
+        release: bool = False
+    ) -> None:
+        """
+        Write run statistics for executed jobs without committing
+        
+        Jobs that share an outcome and schedule get the same new values, so
+        each such bucket is one UPDATE with server-side counter increments
+        rather than a read-modify-write per job.
+        
+        Args:
+            outcomes: (job, succeeded) pairs
+            now: When the runs finished; also the base for next_run_at
+            release: Return claimed (RUNNING) jobs to ACTIVE; jobs paused
+                while running keep their new status
+        """
+        buckets = defaultdict(list)
+        for job, succeeded in outcomes:
+            buckets[(succeeded, job.frequency, job.interval_minutes)].append(job.id)
+        
+        for (succeeded, frequency, interval_minutes), job_ids in buckets.items():
+            counter = MonitoringJob.successful_runs if succeeded else MonitoringJob.failed_runs
+            next_run_at = self._calculate_next_run_time(frequency, interval_minutes, now=now)
+            values = {
+                MonitoringJob.total_runs: MonitoringJob.total_runs + 1,
+                counter: counter + 1,
+                MonitoringJob.last_run_at: now,
+                MonitoringJob.next_run_at: next_run_at
+            }
+            if release:
+                values[MonitoringJob.status] = case(
+                    (MonitoringJob.status == MonitoringStatus.RUNNING,
+                     literal(MonitoringStatus.ACTIVE, MonitoringJob.status.type)),
+                    else_=MonitoringJob.status
+                )
+            # RETURNING the updated rows refreshes jobs loaded in this session
+            # with the database's values in the same round-trip, instead of
+            # replaying the increment on possibly stale in-memory copies
+            self.db.execute(
+                update(MonitoringJob)
+                .where(MonitoringJob.id.in_(job_ids))
+                .values(values)
+                .returning(MonitoringJob),
+                execution_options={'synchronize_session': 'fetch', 'populate_existing': True}
+            ).all()
+            for job_id in job_ids:
+                _due_jobs.schedule(job_id, next_run_at)
     
     def process_pending_jobs(self) -> List[MonitoringRun]:
         """
         Process all jobs that are due to run
         
+        Synchronous entry point for the scheduler scripts; must not be called
+        from inside a running event loop.
+        
+        Returns:
+            List of MonitoringRun instances
+        """
+        return asyncio.run(self.process_pending_jobs_async())
+    
+    async def process_pending_jobs_async(
+        self, 
+        max_concurrent: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> List[MonitoringRun]:
+        """
+        Process all jobs that are due to run, downloading concurrently
+        
+        Due jobs are claimed first so other scheduler processes skip them.
+        Besides the overall limit, each platform has its own cap
+        (settings.MONITORING_CONCURRENCY_<PLATFORM>) so a batch dominated by
+        one platform doesn't trip its rate limits. In-progress runs for the
+        whole batch are inserted up front in one statement; results and job
+        statistics are written after the downloads finish and committed once,
+        instead of committing two or three times per job. If either write
+        fails, the claimed jobs are released back to ACTIVE.
+        
+        Args:
+            max_concurrent: Maximum number of downloads in flight
+                (defaults to settings.MONITORING_MAX_CONCURRENT)
+            batch_size: Maximum number of jobs to claim
+                (defaults to settings.MONITORING_BATCH_SIZE)
+            
         Returns:
             List of MonitoringRun instances
         """
-        pending_jobs = self.get_pending_jobs()
-        runs = []
+        with self._keep_loaded_on_commit():
+            return await self._process_claimed_batch(max_concurrent, batch_size)
+    
+    async def _process_claimed_batch(
+        self, 
+        max_concurrent: Optional[int],
+        batch_size: Optional[int]
+    ) -> List[MonitoringRun]:
+        """Claim, download and record one batch of due jobs; see process_pending_jobs_async"""
+        pending_jobs = self.claim_pending_jobs(batch_size or settings.MONITORING_BATCH_SIZE)
+        if not pending_jobs:
+            return []
         
+        semaphore = asyncio.Semaphore(max(1, max_concurrent or settings.MONITORING_MAX_CONCURRENT))
+        platform_semaphores = {
+            platform: asyncio.Semaphore(self._platform_concurrency(platform))
+            for platform in {job.platform for job in pending_jobs}
+        }
+        downloads = []
         for job in pending_jobs:
             try:
-                run = self.execute_job(job.id)
-                runs.append(run)
+                downloads.append(self._prepare_download(job))
             except Exception as e:
-                logger.exception(f"Error processing job {job.job_id}: {str(e)}")
+                downloads.append(e)
+        
+        # One multi-row INSERT ... RETURNING, so every claimed job shows an
+        # in-progress run while the batch downloads
+        claimed_at = datetime.now(timezone.utc)
+        try:
+            runs = self.db.scalars(
+                insert(MonitoringRun).returning(MonitoringRun, sort_by_parameter_order=True),
+                [
+                    {
+                        'monitoring_job_id': job.id,
+                        'status': DownloadStatus.IN_PROGRESS,
+                        'start_time': claimed_at
+                    }
+                    for job in pending_jobs
+                ]
+            ).all()
+            self.db.commit()
+        except Exception:
+            logger.exception("Failed to record monitoring runs; releasing claimed jobs")
+            self._release_claims(pending_jobs, [])
+            raise
+        
+        results = await asyncio.gather(
+            *(
+                self._run_guarded(semaphore, platform_semaphores[job.platform], download)
+                for job, download in zip(pending_jobs, downloads)
+            ),
+            return_exceptions=True
+        )
+        
+        now = datetime.now(timezone.utc)
+        try:
+            stats = []
+            for job, run, result in zip(pending_jobs, runs, results):
+                if isinstance(result, BaseException):
+                    # Cancelled before the download could report its timing
+                    start_time, end_time, outcome = now, now, result
+                else:
+                    start_time, end_time, outcome = result
+                run.start_time = start_time
+                stats.append((job, self._apply_outcome(job, run, outcome, end_time)))
+            
+            self._update_job_stats(stats, now, release=True)
+            self.db.commit()
+        except Exception:
+            logger.exception("Failed to record monitoring results; releasing claimed jobs")
+            self._release_claims(pending_jobs, runs)
+            raise
         
         return runs
     
+    def _release_claims(self, jobs: List[MonitoringJob], runs: List[MonitoringRun]) -> None:
+        """
+        Return claimed jobs to ACTIVE after a failed write, and fail their open runs
+        
+        The jobs keep their claim time as next_run_at, so the next pass picks
+        them up again. Errors are logged rather than raised so the original
+        failure propagates.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            self.db.rollback()
+            job_ids = [job.id for job in jobs]
+            self.db.execute(
+                update(MonitoringJob)
+                .where(MonitoringJob.id.in_(job_ids), MonitoringJob.status == MonitoringStatus.RUNNING)
+                .values(status=MonitoringStatus.ACTIVE)
+            )
+            if runs:
+                self.db.execute(
+                    update(MonitoringRun)
+                    .where(
+                        MonitoringRun.id.in_([run.id for run in runs]),
+                        MonitoringRun.status == DownloadStatus.IN_PROGRESS
+                    )
+                    .values(
+                        status=DownloadStatus.FAILED,
+                        end_time=now,
+                        error_message="Run results could not be recorded"
+                    )
+                )
+            self.db.commit()
+            for job in jobs:
+                _due_jobs.schedule(job.id, job.next_run_at)
+        except Exception:
+            logger.exception("Failed to release claimed monitoring jobs")
+            self.db.rollback()
+    
+    async def _run_guarded(
+        self, 
+        semaphore: asyncio.Semaphore, 
+        platform_semaphore: asyncio.Semaphore,
+        download: Union[Callable[[], Dict[str, Any]], Exception]
+    ) -> Tuple[datetime, datetime, Union[Dict[str, Any], Exception]]:
+        """
+        Run a bound download in a worker thread once concurrency slots are free
+        
+        Returns:
+            Tuple of (download start, download end, its result or the exception it raised)
+        """
+        if isinstance(download, Exception):
+            now = datetime.now(timezone.utc)
+            return now, now, download
+        # Take the platform slot first so jobs queued behind a busy platform
+        # don't hold overall slots that other platforms could use
+        async with platform_semaphore, semaphore:
+            start_time = datetime.now(timezone.utc)
+            try:
+                outcome = await asyncio.to_thread(download)
+            except Exception as e:
+                outcome = e
+            return start_time, datetime.now(timezone.utc), outcome
+    
+    @staticmethod
+    def _platform_concurrency(platform: PlatformType) -> int:
+        """Maximum concurrent downloads for a platform"""
+        limit = getattr(settings, f"MONITORING_CONCURRENCY_{platform.name}", settings.MONITORING_MAX_CONCURRENT)
+        return max(1, limit)
+    
     def pause_job(self, job_id: int) -> Optional[MonitoringJob]:
         """
         Pause a monitoring job
@@ -350,6 +1013,7 @@ class MonitoringService:
         job.status = MonitoringStatus.PAUSED
         self.db.commit()
         self.db.refresh(job)
+        self._index_job(job)
         
         logger.info(f"Paused monitoring job: {job.job_id} ({job.name})")
         return job
@@ -372,6 +1036,7 @@ class MonitoringService:
         job.next_run_at = self._calculate_next_run_time(job.frequency, job.interval_minutes)
         self.db.commit()
         self.db.refresh(job)
+        self._index_job(job)
         
         logger.info(f"Resumed monitoring job: {job.job_id} ({job.name})")
         return job
@@ -392,10 +1057,33 @@ class MonitoringService:
             MonitoringRun.monitoring_job_id == job_id
         ).order_by(MonitoringRun.start_time.desc()).offset(skip).limit(limit).all()
     
+    def iter_job_runs(self, job_id: int, chunk_size: int = 500) -> Iterator[MonitoringRun]:
+        """
+        Stream the full run history for a monitoring job, newest first
+        
+        Rows are fetched through a server-side cursor in chunks of
+        chunk_size, so memory stays bounded however long the history is.
+        Use this for exports and other single-pass consumers; the session
+        must stay open until iteration finishes.
+        
+        Args:
+            job_id: ID of the job
+            chunk_size: Number of rows fetched per round-trip
+            
+        Yields:
+            MonitoringRun instances
+        """
+        stmt = select(MonitoringRun).where(
+            MonitoringRun.monitoring_job_id == job_id
+        ).order_by(MonitoringRun.start_time.desc()).execution_options(yield_per=chunk_size)
+        
+        yield from self.db.execute(stmt).scalars()
+    
     def _calculate_next_run_time(
         self, 
         frequency: MonitoringFrequency, 
-        interval_minutes: Optional[int] = None
+        interval_minutes: Optional[int] = None,
+        now: Optional[datetime] = None
     ) -> datetime:
         """
         Calculate the next run time based on frequency
@@ -403,46 +1091,39 @@ class MonitoringService:
         Args:
             frequency: The monitoring frequency
             interval_minutes: Custom interval in minutes (for CUSTOM frequency)
+            now: Time to schedule from (defaults to the current time)
             
         Returns:
             Datetime of the next scheduled run
         """
-        now = datetime.utcnow()
-        
-        if frequency == MonitoringFrequency.HOURLY:
-            return now + timedelta(hours=1)
-        elif frequency == MonitoringFrequency.DAILY:
-            return now + timedelta(days=1)
-        elif frequency == MonitoringFrequency.WEEKLY:
-            return now + timedelta(weeks=1)
-        elif frequency == MonitoringFrequency.MONTHLY:
-            # Approximate a month as 30 days
-            return now + timedelta(days=30)
-        elif frequency == MonitoringFrequency.CUSTOM:
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
+        if frequency is MonitoringFrequency.CUSTOM:
             if not interval_minutes or interval_minutes < 1:
                 # Default to hourly if no valid interval provided
                 return now + timedelta(hours=1)
             return now + timedelta(minutes=interval_minutes)
-        else:
-            # Default to daily
-            return now + timedelta(days=1)
+        
+        # Default to daily
+        return now + _FREQUENCY_DELTAS.get(frequency, timedelta(days=1))
     
     def _send_notification(self, job: MonitoringJob, message: str, error: Optional[str] = None) -> None:
         """
-        Send a notification for a monitoring job
+        Queue a notification for a monitoring job
+        
+        Delivery happens on the dispatcher's worker thread, so this returns
+        without waiting on email. Job fields are read here because ORM
+        objects must not cross threads.
         
         Args:
             job: The monitoring job
             message: The notification message
             error: Optional error message
         """
-        # This is a placeholder for the actual notification logic
-        # In a real implementation, this would send emails, push notifications, etc.
-        logger.info(f"NOTIFICATION for job {job.job_id}: {message}")
-        if error:
-            logger.info(f"Error details: {error}")
-        
-        # TODO: Implement actual notification logic
-        # Example: Send email notification
-        if job.notification_email:
-            pass  # Implement email sending
+        notification_dispatcher.submit(
+            job.job_id,
+            message,
+            error=error,
+            email=job.notification_email
+        )
@@ -8,14 +8,120 @@ and topic modeling.
 import logging
 from typing import Dict, List, Optional, Any, Union, Tuple
 import re
+import sys
+import copy
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 import json
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every analysis, compiled once at import
 
-@dataclass
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+
+# Special characters to blank out, keeping basic punctuation for sentence
+# detection. ASCII text goes through the translate table, a single C-level
+# pass; the regex is the fallback for text with non-ASCII characters.
+_NONWORD_RE = re.compile(r'[^\w\s.,!?]')
+_ASCII_NONWORD_TABLE = str.maketrans({
+    i: ' ' for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) in '_.,!?')
+})
+
+# One match per non-blank run of text between sentence terminators
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+# Every entity type in one alternation; the named group that matched is
+# the entity type
+_ENTITY_RE = re.compile(
+    r'(?P<EMAIL>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<URL>https?://\S+|www\.\S+)'
+    r'|(?P<HASHTAG>#\w+)'
+    r'|(?P<MENTION>@\w+)'
+)
+
+# Word lists, built once at import and shared by every NLPService. Entries
+# are interned so lookups of interned tokens compare by identity.
+
+# Basic English stop words
+_STOP_WORDS = frozenset(map(sys.intern, {
+    "a", "an", "the", "and", "but", "if", "or", "because", "as", "until", 
+    "while", "of", "at", "by", "for", "with", "about", "against", "between",
+    "into", "through", "during", "before", "after", "above", "below", "to",
+    "from", "up", "down", "in", "out", "on", "off", "over", "under", "again",
+    "further", "then", "once", "here", "there", "when", "where", "why", "how",
+    "all", "any", "both", "each", "few", "more", "most", "other", "some", "such",
+    "no", "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s",
+    "t", "can", "will", "just", "don", "don't", "should", "should've", "now", "d",
+    "ll", "m", "o", "re", "ve", "y", "ain", "aren", "aren't", "couldn", "couldn't",
+    "didn", "didn't", "doesn", "doesn't", "hadn", "hadn't", "hasn", "hasn't", 
+    "haven", "haven't", "isn", "isn't", "ma", "mightn", "mightn't", "mustn",
+    "mustn't", "needn", "needn't", "shan", "shan't", "shouldn", "shouldn't", 
+    "wasn", "wasn't", "weren", "weren't", "won", "won't", "wouldn", "wouldn't",
+    "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "your",
+    "yours", "yourself", "yourselves", "he", "him", "his", "himself", "she", 
+    "her", "hers", "herself", "it", "its", "itself", "they", "them", "their",
+    "theirs", "themselves", "what", "which", "who", "whom", "this", "that", 
+    "these", "those", "am", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "having", "do", "does", "did", "doing"
+}))
+
+_POSITIVE_WORDS = frozenset(map(sys.intern, {
+    "amazing", "appreciate", "appreciated", "awesome", "beautiful",
+    "beneficial", "best", "better", "brilliant", "congrats", "congratulations",
+    "delightful", "easy", "effective", "efficient", "enjoy", "excellent",
+    "exceptional", "excited", "extraordinary", "fabulous", "fantastic",
+    "favorite", "glorious", "good", "grateful", "great", "happy", "helpful",
+    "impressive", "incredible", "innovative", "inspired", "inspiring", "joy",
+    "liked", "love", "magnificent", "marvelous", "nice", "outstanding",
+    "perfect", "pleasant", "pleased", "positive", "praise", "proud", "quality",
+    "recommend", "recommended", "remarkable", "satisfied", "satisfying",
+    "sensational", "splendid", "stunning", "success", "successful", "super",
+    "superb", "superior", "terrific", "thankful", "thrilled", "useful",
+    "valuable", "win", "winner", "wonderful", "worth"
+}))
+
+_NEGATIVE_WORDS = frozenset(map(sys.intern, {
+    "abysmal", "angry", "annoyed", "annoying", "apology", "appalling",
+    "atrocious", "awful", "bad", "broken", "bug", "bugs", "catastrophe",
+    "cheap", "complaining", "complaint", "complicated", "confused", "confusing",
+    "costly", "defective", "deficient", "difficult", "disappointed",
+    "disappointing", "disaster", "dislike", "dissatisfied", "dreadful", "error",
+    "errors", "expensive", "fail", "failed", "failure", "flawed", "frustrated",
+    "frustrating", "hard", "hate", "horrible", "inadequate", "ineffective",
+    "inefficient", "inferior", "intolerable", "issue", "issues", "lousy",
+    "mediocre", "negative", "overpriced", "pathetic", "poor", "problem",
+    "problematic", "regret", "regretful", "sad", "sorry", "subpar", "terrible",
+    "trouble", "unacceptable", "unfair", "unfortunate", "unhappy", "unpleasant",
+    "unreliable", "unsatisfied", "upset", "useless", "waste", "worst",
+    "worthless", "wrong"
+}))
+
+# Both lexicons merged so each word needs a single lookup;
+# True for positive words, False for negative ones
+_SENTIMENT_LEXICON = {**dict.fromkeys(_NEGATIVE_WORDS, False), **dict.fromkeys(_POSITIVE_WORDS, True)}
+
+
+def _char_mask(word: str) -> int:
+    """Bitmask with one bit set per distinct character of word"""
+    mask = 0
+    for char in word:
+        mask |= 1 << ord(char)
+    return mask
+
+
+def _mask_similarity(mask1: int, mask2: int) -> float:
+    """Jaccard similarity of two character masks"""
+    union = (mask1 | mask2).bit_count()
+    if union == 0:
+        return 0
+    return (mask1 & mask2).bit_count() / union
+
+
+@dataclass(slots=True)
 class NLPResult:
     """Container for NLP analysis results"""
     # Sentiment analysis
@@ -73,6 +179,13 @@ class NLPResult:
 class NLPService:
     """Service for text analysis using NLP techniques"""
     
+    # Results for recently analyzed texts, shared by all instances since
+    # callers create a service per request. Reposts and spam repeat the
+    # same text often enough that hits are common.
+    RESULT_CACHE_SIZE = 10000
+    _result_cache: "OrderedDict[str, NLPResult]" = OrderedDict()
+    _result_cache_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize NLP service with basic text processing capabilities"""
         # Initialize basic NLP components
@@ -81,6 +194,7 @@ class NLPService:
         # Initialize sentiment analysis components
         self.positive_words = self._load_lexicon("positive")
         self.negative_words = self._load_lexicon("negative")
+        self.sentiment_lexicon = _SENTIMENT_LEXICON
         
         logger.info("NLP Service initialized with basic text processing capabilities")
     
@@ -98,32 +212,112 @@ class NLPService:
             logger.warning("Invalid text provided for NLP analysis")
             return NLPResult()
         
+        cached = self._get_cached_result(text)
+        if cached is not None:
+            return cached
+        
+        result = self._analyze(text)
+        
+        logger.info(f"Completed NLP analysis: sentiment={result.sentiment_label}, "
+                   f"entities={len(result.entities)}, keywords={len(result.keywords)}")
+        
+        self._cache_result(text, result)
+        return result
+    
+    def analyze_texts(self, texts: List[str]) -> List[NLPResult]:
+        """
+        Analyze many texts in one call
+        
+        Equivalent to calling analyze_text on each text, but logs once per
+        batch rather than once per text.
+        
+        Args:
+            texts: Text contents to analyze
+            
+        Returns:
+            List[NLPResult]: One result per text, in input order
+        """
+        results = []
+        invalid = 0
+        for text in texts:
+            if not text or not isinstance(text, str):
+                invalid += 1
+                results.append(NLPResult())
+                continue
+            
+            result = self._get_cached_result(text)
+            if result is None:
+                result = self._analyze(text)
+                self._cache_result(text, result)
+            results.append(result)
+        
+        if invalid:
+            logger.warning(f"{invalid} invalid texts provided for NLP analysis")
+        logger.info(f"Completed NLP analysis of {len(results)} texts")
+        
+        return results
+    
+    def _analyze(self, text: str) -> NLPResult:
+        """
+        Run every analyzer over a non-empty text
+        
+        Args:
+            text: Text content to analyze
+            
+        Returns:
+            NLPResult: Container with analysis results
+        """
         # Preprocess text
         clean_text = self._preprocess_text(text)
         
+        # Tokenize once and share the tokens between the analyzers
+        words = clean_text.split()
+        filtered = [w for w in words if w not in self.stop_words]
+        
         # Create result container
         result = NLPResult()
         
         # Perform text statistics analysis
-        self._analyze_text_statistics(clean_text, result)
+        self._analyze_text_statistics(clean_text, filtered, result)
         
         # Perform sentiment analysis
-        self._analyze_sentiment(clean_text, result)
+        self._analyze_sentiment(words, result)
         
         # Extract keywords
-        self._extract_keywords(clean_text, result)
+        self._extract_keywords(filtered, result)
         
-        # Extract entities (simple implementation)
-        self._extract_entities(clean_text, result)
+        # Extract entities (simple implementation) from the raw text, since
+        # preprocessing strips the URLs, '@' and '#' they are made of
+        self._extract_entities(text, result)
         
         # Identify topics (simple implementation)
         self._identify_topics(clean_text, result)
         
-        logger.info(f"Completed NLP analysis: sentiment={result.sentiment_label}, "
-                   f"entities={len(result.entities)}, keywords={len(result.keywords)}")
-        
         return result
     
+    def _get_cached_result(self, text: str) -> Optional[NLPResult]:
+        """
+        Look up a previous analysis of the exact same text
+        
+        Returns:
+            A copy of the cached result the caller may modify, or None
+        """
+        with self._result_cache_lock:
+            result = self._result_cache.get(text)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(text)
+        return copy.deepcopy(result)
+    
+    def _cache_result(self, text: str, result: NLPResult) -> None:
+        """Store a copy of a result, evicting the least recently used entry"""
+        snapshot = copy.deepcopy(result)
+        with self._result_cache_lock:
+            self._result_cache[text] = snapshot
+            self._result_cache.move_to_end(text)
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
     def analyze_post(self, post_data: Dict[str, Any]) -> NLPResult:
         """
         Analyze a post's text content from various fields
@@ -135,26 +329,32 @@ class NLPService:
             NLPResult: Container with analysis results
         """
         # Combine relevant text fields with appropriate weighting
-        combined_text = ""
+        parts = []
         
         # Add title with more weight (repeat it)
-        if "title" in post_data and post_data["title"]:
-            combined_text += f"{post_data['title']} {post_data['title']} "
+        title = post_data.get("title")
+        if title:
+            parts.extend((title, title))
         
         # Add description
-        if "description" in post_data and post_data["description"]:
-            combined_text += f"{post_data['description']} "
+        description = post_data.get("description")
+        if description:
+            parts.append(description)
         
         # Add content text
-        if "content_text" in post_data and post_data["content_text"]:
-            combined_text += f"{post_data['content_text']} "
+        content_text = post_data.get("content_text")
+        if content_text:
+            parts.append(content_text)
         
         # Add hashtags
-        if "hashtags" in post_data and post_data["hashtags"]:
-            if isinstance(post_data["hashtags"], list):
-                combined_text += " ".join(post_data["hashtags"]) + " "
-            elif isinstance(post_data["hashtags"], str):
-                combined_text += post_data["hashtags"] + " "
+        hashtags = post_data.get("hashtags")
+        if hashtags:
+            if isinstance(hashtags, list):
+                parts.extend(hashtags)
+            elif isinstance(hashtags, str):
+                parts.append(hashtags)
+        
+        combined_text = " ".join(parts)
         
         if not combined_text.strip():
             logger.warning("No text content found in post data for NLP analysis")
@@ -175,40 +375,37 @@ class NLPService:
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove URLs
-        text = re.sub(r'https?://\S+|www\.\S+', '', text)
-        
-        # Remove special characters but keep spaces and basic punctuation for sentence detection
-        text = re.sub(r'[^\w\s.,!?]', ' ', text)
+        # Lowercase and blank out URLs
+        text = _URL_RE.sub(' ', text.lower())
         
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Blank out special characters
+        if text.isascii():
+            text = text.translate(_ASCII_NONWORD_TABLE)
+        else:
+            text = _NONWORD_RE.sub(' ', text)
         
-        return text
+        # Collapse runs of whitespace to single spaces
+        return ' '.join(text.split())
     
-    def _analyze_text_statistics(self, text: str, result: NLPResult) -> None:
+    def _analyze_text_statistics(self, text: str, words: List[str], result: NLPResult) -> None:
         """
         Calculate basic text statistics
         
         Args:
             text: Preprocessed text
+            words: Tokens of the text with stop words removed
             result: NLPResult object to update
         """
         # Count words (excluding stop words for more meaningful count)
-        words = [w for w in text.split() if w.lower() not in self.stop_words]
         result.word_count = len(words)
         
         # Count sentences (simple approach)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        result.sentence_count = len(sentences)
+        result.sentence_count = len(_SENTENCE_RE.findall(text))
         
         # Calculate average word length
+        char_total = sum(map(len, words))
         if result.word_count > 0:
-            result.avg_word_length = sum(len(word) for word in words) / result.word_count
+            result.avg_word_length = char_total / result.word_count
         
         # Calculate average sentence length
         if result.sentence_count > 0:
@@ -220,22 +417,28 @@ class NLPService:
             # Higher score = easier to read
             result.readability_score = max(0, min(100, 
                 206.835 - 1.015 * (result.word_count / result.sentence_count) 
-                - 84.6 * (sum(len(word) for word in words) / result.word_count / 3)
+                - 84.6 * (char_total / result.word_count / 3)
             ))
     
-    def _analyze_sentiment(self, text: str, result: NLPResult) -> None:
+    def _analyze_sentiment(self, words: List[str], result: NLPResult) -> None:
         """
         Perform basic sentiment analysis
         
         Args:
-            text: Preprocessed text
+            words: Tokens of the preprocessed text
             result: NLPResult object to update
         """
-        words = text.split()
-        
-        # Count positive and negative words
-        positive_count = sum(1 for word in words if word in self.positive_words)
-        negative_count = sum(1 for word in words if word in self.negative_words)
+        # Count positive and negative words, looking each distinct word up once
+        positive_count = negative_count = 0
+        lexicon = self.sentiment_lexicon
+        for word, count in Counter(words).items():
+            is_positive = lexicon.get(word)
+            if is_positive is None:
+                continue
+            if is_positive:
+                positive_count += count
+            else:
+                negative_count += count
         
         # Calculate sentiment score (-1 to 1)
         total_count = positive_count + negative_count
@@ -255,33 +458,22 @@ class NLPService:
         else:
             result.sentiment_label = "neutral"
     
-    def _extract_keywords(self, text: str, result: NLPResult) -> None:
+    def _extract_keywords(self, words: List[str], result: NLPResult) -> None:
         """
         Extract important keywords from text
         
         Args:
-            text: Preprocessed text
+            words: Tokens of the text with stop words removed
             result: NLPResult object to update
         """
-        words = text.split()
-        
-        # Filter out stop words
-        filtered_words = [word for word in words if word.lower() not in self.stop_words]
+        # Count word frequencies, only considering words with more than 2 characters
+        word_freq = Counter(word for word in words if len(word) > 2)
         
-        # Count word frequencies
-        word_freq = {}
-        for word in filtered_words:
-            if len(word) > 2:  # Only consider words with more than 2 characters
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Sort by frequency
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        
-        # Take top keywords
-        top_keywords = sorted_words[:10]
+        # Take top keywords by frequency
+        top_keywords = word_freq.most_common(10)
         
         # Calculate relevance score (0-1)
-        max_freq = max([freq for _, freq in top_keywords]) if top_keywords else 1
+        max_freq = top_keywords[0][1] if top_keywords else 1
         
         # Format keywords with relevance scores
         result.keywords = [
@@ -294,46 +486,17 @@ class NLPService:
         Extract named entities from text (simplified version)
         
         Args:
-            text: Preprocessed text
+            text: Raw text, before preprocessing
             result: NLPResult object to update
         """
         # This is a simplified placeholder implementation
         # In a real implementation, this would use a proper NER model
         
-        # Simple pattern matching for some entity types
-        # Email pattern
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        for email in emails:
-            result.entities.append({
-                "text": email,
-                "type": "EMAIL",
-                "confidence": 0.9
-            })
-        
-        # URL pattern (simplified)
-        urls = re.findall(r'https?://\S+|www\.\S+', text)
-        for url in urls:
-            result.entities.append({
-                "text": url,
-                "type": "URL",
-                "confidence": 0.9
-            })
-        
-        # Hashtag pattern
-        hashtags = re.findall(r'#\w+', text)
-        for hashtag in hashtags:
+        # Simple pattern matching for some entity types, in a single scan
+        for match in _ENTITY_RE.finditer(text):
             result.entities.append({
-                "text": hashtag,
-                "type": "HASHTAG",
-                "confidence": 0.9
-            })
-        
-        # Mention pattern
-        mentions = re.findall(r'@\w+', text)
-        for mention in mentions:
-            result.entities.append({
-                "text": mention,
-                "type": "MENTION",
+                "text": match.group(),
+                "type": match.lastgroup,
                 "confidence": 0.9
             })
     
@@ -349,40 +512,55 @@ class NLPService:
         # In a real implementation, this would use topic modeling (LDA, etc.)
         
         # Use keyword clusters as simple topics
-        if result.keywords:
-            # Group similar keywords (simplified)
-            topics = []
-            used_keywords = set()
+        if not result.keywords:
+            return
+        
+        # Group similar keywords (simplified)
+        topics = []
+        used_keywords = set()
+        masks = {k["keyword"]: _char_mask(k["keyword"]) for k in result.keywords}
+        
+        # Bucket keywords by their first three characters, in relevance
+        # order; keywords are longer than two characters, so any prefix
+        # match lands in the same bucket and only bucket-mates are compared
+        buckets = {}
+        for keyword_data in result.keywords:
+            keyword = keyword_data["keyword"]
+            buckets.setdefault(keyword[:3], []).append(keyword)
+        
+        for keyword_data in result.keywords:
+            keyword = keyword_data["keyword"]
+            if keyword in used_keywords:
+                continue
             
-            for keyword_data in result.keywords:
-                keyword = keyword_data["keyword"]
-                if keyword in used_keywords:
-                    continue
-                
-                # Find related keywords
-                related_keywords = []
-                for other_data in result.keywords:
-                    other_keyword = other_data["keyword"]
-                    if other_keyword not in used_keywords and (
-                        other_keyword.startswith(keyword) or 
-                        keyword.startswith(other_keyword) or
-                        self._calculate_similarity(keyword, other_keyword) > 0.7
-                    ):
-                        related_keywords.append(other_keyword)
-                        used_keywords.add(other_keyword)
-                
-                if related_keywords:
-                    topics.append({
-                        "name": keyword,
-                        "keywords": related_keywords,
-                        "relevance": keyword_data["relevance"]
-                    })
-                    
-                    # Limit to top 5 topics
-                    if len(topics) >= 5:
-                        break
+            # Find related keywords among those not yet assigned a topic;
+            # grouped keywords leave the bucket so later passes skip them
+            related_keywords = []
+            remaining = []
+            for other_keyword in buckets[keyword[:3]]:
+                if (
+                    other_keyword.startswith(keyword) or 
+                    keyword.startswith(other_keyword) or
+                    _mask_similarity(masks[keyword], masks[other_keyword]) > 0.7
+                ):
+                    related_keywords.append(other_keyword)
+                    used_keywords.add(other_keyword)
+                else:
+                    remaining.append(other_keyword)
+            buckets[keyword[:3]] = remaining
             
-            result.topics = topics
+            if related_keywords:
+                topics.append({
+                    "name": keyword,
+                    "keywords": related_keywords,
+                    "relevance": keyword_data["relevance"]
+                })
+                
+                # Limit to top 5 topics
+                if len(topics) >= 5:
+                    break
+        
+        result.topics = topics
     
     def _calculate_similarity(self, word1: str, word2: str) -> float:
         """
@@ -395,50 +573,19 @@ class NLPService:
         Returns:
             float: Similarity score (0-1)
         """
-        # Convert to sets of characters
-        set1 = set(word1)
-        set2 = set(word2)
-        
-        # Calculate Jaccard similarity
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-        
-        if union == 0:
-            return 0
-        
-        return intersection / union
+        # Jaccard similarity of the character sets, as bitmasks
+        return _mask_similarity(_char_mask(word1), _char_mask(word2))
     
-    def _load_stop_words(self) -> set:
+    def _load_stop_words(self) -> frozenset:
         """
         Load common English stop words
         
         Returns:
-            set: Set of stop words
+            frozenset: Interned stop words
         """
-        # Basic English stop words
-        return {
-            "a", "an", "the", "and", "but", "if", "or", "because", "as", "until", 
-            "while", "of", "at", "by", "for", "with", "about", "against", "between",
-            "into", "through", "during", "before", "after", "above", "below", "to",
-            "from", "up", "down", "in", "out", "on", "off", "over", "under", "again",
-            "further", "then", "once", "here", "there", "when", "where", "why", "how",
-            "all", "any", "both", "each", "few", "more", "most", "other", "some", "such",
-            "no", "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s",
-            "t", "can", "will", "just", "don", "don't", "should", "should've", "now", "d",
-            "ll", "m", "o", "re", "ve", "y", "ain", "aren", "aren't", "couldn", "couldn't",
-            "didn", "didn't", "doesn", "doesn't", "hadn", "hadn't", "hasn", "hasn't", 
-            "haven", "haven't", "isn", "isn't", "ma", "mightn", "mightn't", "mustn",
-            "mustn't", "needn", "needn't", "shan", "shan't", "shouldn", "shouldn't", 
-            "wasn", "wasn't", "weren", "weren't", "won", "won't", "wouldn", "wouldn't",
-            "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "your",
-            "yours", "yourself", "yourselves", "he", "him", "his", "himself", "she", 
-            "her", "hers", "herself", "it", "its", "itself", "they", "them", "their",
-            "theirs", "themselves", "what", "which", "who", "whom", "this", "that", 
-            "these", "those", "am", "is", "are", "was", "were", "be", "been", "being",
-            "have", "has", "had", "having", "do", "does", "did", "doing"
-        }
+        return _STOP_WORDS
     
-    def _load_lexicon(self, sentiment_type: str) -> set:
+    def _load_lexicon(self, sentiment_type: str) -> frozenset:
         """
         Load sentiment lexicon (positive or negative words)
         
@@ -446,38 +593,11 @@ class NLPService:
             sentiment_type: Type of lexicon ("positive" or "negative")
             
         Returns:
-            set: Set of words with the specified sentiment
+            frozenset: Interned words with the specified sentiment
         """
         if sentiment_type == "positive":
-            return {
-                "good", "great", "excellent", "amazing", "awesome", "fantastic", 
-                "wonderful", "brilliant", "outstanding", "superb", "perfect", "best",
-                "love", "happy", "joy", "excited", "beautiful", "impressive", "incredible",
-                "enjoy", "liked", "favorite", "positive", "success", "successful", "win",
-                "winner", "beneficial", "better", "helpful", "recommend", "recommended",
-                "worth", "valuable", "nice", "pleased", "satisfying", "satisfied", 
-                "impressive", "innovative", "easy", "useful", "effective", "efficient",
-                "quality", "exceptional", "delightful", "pleasant", "superior", "terrific",
-                "thrilled", "grateful", "thankful", "appreciate", "appreciated", "praise",
-                "congratulations", "congrats", "proud", "inspiring", "inspired", "inspiring",
-                "favorite", "fabulous", "fantastic", "remarkable", "sensational", "stunning",
-                "extraordinary", "marvelous", "magnificent", "glorious", "splendid", "super"
-            }
+            return _POSITIVE_WORDS
         elif sentiment_type == "negative":
-            return {
-                "bad", "terrible", "awful", "horrible", "poor", "disappointing", "worst",
-                "hate", "dislike", "disappointed", "sad", "angry", "upset", "annoyed",
-                "annoying", "frustrating", "frustrated", "useless", "waste", "problem",
-                "difficult", "hard", "complicated", "confusing", "confused", "issue",
-                "issues", "bug", "bugs", "error", "errors", "fail", "failed", "failure",
-                "negative", "terrible", "horrible", "awful", "mediocre", "subpar", "inferior",
-                "unacceptable", "inadequate", "defective", "deficient", "flawed", "broken",
-                "unreliable", "ineffective", "inefficient", "overpriced", "expensive",
-                "costly", "cheap", "worthless", "regret", "regretful", "sorry", "apology",
-                "complaint", "complaining", "unhappy", "dissatisfied", "unsatisfied",
-                "unfortunate", "unfortunate", "unpleasant", "unfair", "wrong", "trouble",
-                "problematic", "disaster", "catastrophe", "terrible", "dreadful", "appalling",
-                "atrocious", "abysmal", "pathetic", "lousy", "unacceptable", "intolerable"
-            }
+            return _NEGATIVE_WORDS
         else:
-            return set()
+            return frozenset()
@@ -0,0 +1,145 @@
+"""
+Notification Dispatcher
+Delivers monitoring notifications from a background thread so job execution
+never waits on SMTP
+"""
+
+import atexit
+import logging
+import queue
+import smtplib
+import threading
+from email.message import EmailMessage
+from typing import Any, Dict, List, Optional
+
+from backend.core.config import settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """
+    Queue-backed notification sender
+
+    Producers call submit() and return immediately. A single daemon worker
+    drains the queue in batches and sends every email in a batch over one
+    SMTP connection, so the connection and TLS handshake are paid once per
+    batch rather than once per notification.
+    """
+
+    def __init__(self, max_batch: int = 50):
+        """
+        Initialize the dispatcher
+
+        Args:
+            max_batch: Maximum number of notifications delivered per batch
+        """
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, job_id: str, message: str, error: Optional[str] = None,
+               email: Optional[str] = None) -> None:
+        """
+        Queue a notification for delivery
+
+        Args:
+            job_id: External ID of the monitoring job
+            message: The notification message
+            error: Optional error message
+            email: Address to email, if any
+        """
+        self._ensure_worker()
+        self._queue.put_nowait({
+            'job_id': job_id,
+            'message': message,
+            'error': error,
+            'email': email
+        })
+
+    def flush(self) -> None:
+        """Block until every queued notification has been handled"""
+        if self._worker is not None:
+            self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use"""
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="notification-dispatcher", daemon=True
+                )
+                self._worker.start()
+                # Deliver what is still queued when a one-shot scheduler exits
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        """Worker loop: wait for a notification, then drain up to a batch"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._deliver(batch)
+            except Exception as e:
+                logger.error(f"Error delivering {len(batch)} notifications: {str(e)}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _deliver(self, batch: List[Dict[str, Any]]) -> None:
+        """Log every notification and email those with an address"""
+        emails = []
+        for notification in batch:
+            logger.info(f"NOTIFICATION for job {notification['job_id']}: {notification['message']}")
+            if notification['error']:
+                logger.info(f"Error details: {notification['error']}")
+            if notification['email']:
+                emails.append(notification)
+
+        if not emails:
+            return
+        if not settings.SMTP_HOST:
+            logger.debug(f"SMTP_HOST not configured, skipping {len(emails)} notification emails")
+            return
+
+        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30) as smtp:
+            if settings.SMTP_USE_TLS:
+                smtp.starttls()
+            if settings.SMTP_USERNAME:
+                smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+
+            for notification in emails:
+                # One bad notification (an invalid address or header, a
+                # rejected recipient) must not drop the rest of the batch
+                try:
+                    smtp.send_message(self._build_email(notification))
+                except Exception as e:
+                    logger.error(f"Failed to email notification for job {notification['job_id']}: {str(e)}")
+
+    @staticmethod
+    def _build_email(notification: Dict[str, Any]) -> EmailMessage:
+        """Build the email for a notification, with its message's first line as the subject"""
+        # Header values can't contain line breaks, which failure messages often do
+        lines = notification['message'].strip().splitlines()
+        msg = EmailMessage()
+        msg['Subject'] = lines[0] if lines else f"Monitoring job {notification['job_id']}"
+        msg['From'] = settings.SMTP_FROM
+        msg['To'] = notification['email']
+        body = notification['message']
+        if notification['error']:
+            body += f"\n\nError details: {notification['error']}"
+        msg.set_content(body)
+        return msg
+
+
+# Process-wide dispatcher shared by all monitoring services
+notification_dispatcher = NotificationDispatcher()
@@ -6,16 +6,45 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Dict, Any, Optional, Callable, List
+from enum import StrEnum
+from itertools import accumulate
+from typing import Dict, Any, Optional, Callable, List, Awaitable, Tuple
 from uuid import uuid4
 
+from sqlalchemy import func, update as sql_update
+from sqlalchemy.orm import sessionmaker
+
 logger = logging.getLogger(__name__)
 
+# (DownloadJob, DownloadStatus), imported on first use. Importing db.models
+# at module load would register every model with the declarative base as
+# soon as any downloader is imported, including from code that loads the
+# models under the backend.db package path, which would define them twice.
+_models = None
+
+# ProgressStatus -> DownloadStatus written to the job row, filled in with the
+# models. Statuses not listed leave the job's status alone.
+_STATUS_TO_DB: Dict["ProgressStatus", Any] = {}
+
+
+def _download_models():
+    """Import the download job model once and cache it"""
+    global _models
+    if _models is None:
+        from db.models import DownloadJob, DownloadStatus
+        _STATUS_TO_DB.update({
+            ProgressStatus.COMPLETED: DownloadStatus.COMPLETED,
+            ProgressStatus.FAILED: DownloadStatus.FAILED,
+            ProgressStatus.IN_PROGRESS: DownloadStatus.IN_PROGRESS,
+        })
+        _models = (DownloadJob, DownloadStatus)
+    return _models
+
 
-class ProgressStatus(Enum):
+class ProgressStatus(StrEnum):
     """Progress status enumeration"""
     PENDING = "pending"
     STARTING = "starting"
@@ -26,7 +55,7 @@ class ProgressStatus(Enum):
     CANCELLED = "cancelled"
 
 
-class ProgressStep(Enum):
+class ProgressStep(StrEnum):
     """Download progress steps"""
     INITIALIZING = "initializing"
     VALIDATING_URL = "validating_url"
@@ -38,7 +67,26 @@ class ProgressStep(Enum):
     FINALIZING = "finalizing"
 
 
-@dataclass
+# (monotonic time, UTC wall clock) of the last clock read, reused by updates
+# created within _NOW_RESOLUTION seconds of it
+_NOW_RESOLUTION = 0.01
+_cached_now: Tuple[float, datetime] = (float('-inf'), datetime.min.replace(tzinfo=timezone.utc))
+
+
+def _now_cached() -> datetime:
+    """Current UTC time, to within _NOW_RESOLUTION seconds"""
+    global _cached_now
+    m = time.monotonic()
+    if m - _cached_now[0] > _NOW_RESOLUTION:
+        _cached_now = (m, datetime.now(timezone.utc))
+    return _cached_now[1]
+
+
+# Stable position of each step, used to index the tracker's weight tables
+_STEP_ORDINAL: Dict[ProgressStep, int] = {step: i for i, step in enumerate(ProgressStep)}
+
+
+@dataclass(slots=True, frozen=True)
 class ProgressUpdate:
     """Progress update data structure"""
     task_id: str
@@ -50,8 +98,8 @@ class ProgressUpdate:
     total_items: int = 1
     error: Optional[str] = None
     warning: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    metadata: Optional[Dict[str, Any]] = None
+    timestamp: datetime = field(default_factory=_now_cached)
 
 
 class ProgressCallback(ABC):
@@ -74,95 +122,166 @@ class ProgressCallback(ABC):
 
 
 class DatabaseProgressCallback(ProgressCallback):
-    """Progress callback that stores updates in the database"""
+    """
+    Progress callback that stores updates in the database
+    
+    Progress ticks are coalesced: an update is written only once progress
+    has moved FLUSH_PERCENT points, FLUSH_INTERVAL seconds have passed, or
+    the status changed since the last write. In between, the latest update
+    per task is held in memory. Call flush() to write any held updates.
+    
+    Database work runs on ``executor`` (the loop's default executor when not
+    given) so commits don't block the event loop. Sessions aren't thread-safe
+    and the caller keeps using db_session on the loop thread, so each write
+    opens its own short-lived session on the same engine. Writes through one
+    callback still run one at a time, in the order they were issued.
+    """
     
-    def __init__(self, db_session):
+    FLUSH_INTERVAL = 0.5  # seconds
+    FLUSH_PERCENT = 1.0
+    
+    def __init__(self, db_session, executor: Optional[Executor] = None):
         self.db_session = db_session
+        self._session_factory = sessionmaker(bind=db_session.get_bind(), expire_on_commit=False)
+        self._executor = executor
+        self._db_lock = asyncio.Lock()
+        self._pending: Dict[str, ProgressUpdate] = {}
+        # task id -> (monotonic time, progress, status) of the last write
+        self._last_flush: Dict[str, Tuple[float, float, ProgressStatus]] = {}
     
     async def on_progress_update(self, update: ProgressUpdate) -> None:
         """Store progress update in database"""
+        self._pending[update.task_id] = update
+        if self._should_flush(update):
+            await self._flush_task(update.task_id)
+    
+    async def flush(self) -> None:
+        """Write every held progress update"""
+        for task_id in list(self._pending):
+            await self._flush_task(task_id)
+    
+    def _should_flush(self, update: ProgressUpdate) -> bool:
+        """Whether an update is worth a database write"""
+        if update.status in (ProgressStatus.COMPLETED, ProgressStatus.FAILED):
+            return True
+        last = self._last_flush.get(update.task_id)
+        if last is None:
+            return True
+        flushed_at, flushed_percentage, flushed_status = last
+        return (
+            update.status != flushed_status
+            or abs(update.progress_percentage - flushed_percentage) >= self.FLUSH_PERCENT
+            or time.monotonic() - flushed_at >= self.FLUSH_INTERVAL
+        )
+    
+    async def _run_sync(self, func: Callable[..., None], *args) -> None:
+        """Run a blocking database write on the executor, one at a time"""
+        async with self._db_lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, func, *args)
+    
+    async def _flush_task(self, task_id: str) -> None:
+        """Write the held update for a task, if any"""
+        update = self._pending.pop(task_id, None)
+        if update is None:
+            return
+        self._last_flush[task_id] = (time.monotonic(), update.progress_percentage, update.status)
+        await self._run_sync(self._write_progress_sync, update)
+    
+    def _write_progress_sync(self, update: ProgressUpdate) -> None:
+        """Write a progress update to its job row"""
         try:
-            from db.models import DownloadJob
+            DownloadJob, _ = _download_models()
             
-            # Find or create download job
-            job = self.db_session.query(DownloadJob).filter(
-                DownloadJob.id == update.task_id
-            ).first()
+            values = {
+                "progress_percentage": update.progress_percentage,
+                "processed_items": update.current_item,
+                "total_items": update.total_items,
+                "updated_at": update.timestamp
+            }
             
-            if job:
-                job.progress_percentage = update.progress_percentage
-                job.processed_items = update.current_item
-                job.total_items = update.total_items
-                job.updated_at = update.timestamp
-                
-                # Update status if changed
+            # Update status if changed
+            db_status = _STATUS_TO_DB.get(update.status)
+            if db_status is not None:
+                values["status"] = db_status
                 if update.status == ProgressStatus.COMPLETED:
-                    job.status = "completed"
-                    job.completed_at = update.timestamp
-                elif update.status == ProgressStatus.FAILED:
-                    job.status = "failed"
+                    values["completed_at"] = update.timestamp
                 elif update.status == ProgressStatus.IN_PROGRESS:
-                    job.status = "in_progress"
-                    if not job.started_at:
-                        job.started_at = update.timestamp
-                
-                self.db_session.commit()
+                    values["started_at"] = func.coalesce(DownloadJob.started_at, update.timestamp)
+            
+            # A single UPDATE, with no SELECT of the row first
+            with self._session_factory() as session:
+                result = session.execute(
+                    sql_update(DownloadJob).where(DownloadJob.id == update.task_id).values(**values)
+                )
+                session.commit()
+            if result.rowcount:
                 logger.debug(f"Updated progress for task {update.task_id}: {update.progress_percentage}%")
                 
         except Exception as e:
             logger.error(f"Failed to update progress in database: {e}")
-            self.db_session.rollback()
     
     async def on_error(self, task_id: str, error: str, step: ProgressStep) -> None:
         """Store error in database"""
+        # Write held progress first so the error lands on top of it
+        await self._flush_task(task_id)
+        await self._run_sync(self._write_error_sync, task_id, error, step)
+    
+    def _write_error_sync(self, task_id: str, error: str, step: ProgressStep) -> None:
+        """Append an error to a job's error list"""
         try:
-            from db.models import DownloadJob
+            DownloadJob, _ = _download_models()
             
-            job = self.db_session.query(DownloadJob).filter(
-                DownloadJob.id == task_id
-            ).first()
-            
-            if job:
-                # Add error to errors list
-                current_errors = job.errors or []
-                current_errors.append({
-                    "error": error,
-                    "step": step.value,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
-                job.errors = current_errors
-                job.error_count = len(current_errors)
-                job.status = "failed"
-                job.updated_at = datetime.now(timezone.utc)
+            with self._session_factory() as session:
+                job = session.get(DownloadJob, task_id)
                 
-                self.db_session.commit()
-                logger.error(f"Recorded error for task {task_id}: {error}")
+                if job:
+                    now = datetime.now(timezone.utc)
+                    
+                    # Add error to errors list
+                    current_errors = job.errors or []
+                    current_errors.append({
+                        "error": error,
+                        "step": step.value,
+                        "timestamp": now.isoformat()
+                    })
+                    job.errors = current_errors
+                    job.error_count = len(current_errors)
+                    job.status = _STATUS_TO_DB[ProgressStatus.FAILED]
+                    job.updated_at = now
+                    
+                    session.commit()
+                    logger.error(f"Recorded error for task {task_id}: {error}")
                 
         except Exception as e:
             logger.error(f"Failed to record error in database: {e}")
-            self.db_session.rollback()
     
     async def on_completion(self, task_id: str, success: bool, final_message: str) -> None:
         """Handle completion"""
+        await self._flush_task(task_id)
+        self._last_flush.pop(task_id, None)
+        await self._run_sync(self._write_completion_sync, task_id, success, final_message)
+    
+    def _write_completion_sync(self, task_id: str, success: bool, final_message: str) -> None:
+        """Mark a job as finished"""
         try:
-            from db.models import DownloadJob
+            DownloadJob, _ = _download_models()
             
-            job = self.db_session.query(DownloadJob).filter(
-                DownloadJob.id == task_id
-            ).first()
-            
-            if job:
-                job.status = "completed" if success else "failed"
-                job.completed_at = datetime.now(timezone.utc)
-                job.progress_percentage = 100.0 if success else job.progress_percentage
-                job.updated_at = datetime.now(timezone.utc)
+            with self._session_factory() as session:
+                job = session.get(DownloadJob, task_id)
                 
-                self.db_session.commit()
-                logger.info(f"Task {task_id} completed: {final_message}")
+                if job:
+                    now = datetime.now(timezone.utc)
+                    job.status = _STATUS_TO_DB[ProgressStatus.COMPLETED if success else ProgressStatus.FAILED]
+                    job.completed_at = now
+                    job.progress_percentage = 100.0 if success else job.progress_percentage
+                    job.updated_at = now
+                    
+                    session.commit()
+                    logger.info(f"Task {task_id} completed: {final_message}")
                 
         except Exception as e:
             logger.error(f"Failed to record completion in database: {e}")
-            self.db_session.rollback()
 
 
 class LoggingProgressCallback(ProgressCallback):
@@ -173,53 +292,77 @@ class LoggingProgressCallback(ProgressCallback):
     
     async def on_progress_update(self, update: ProgressUpdate) -> None:
         """Log progress update"""
+        # Progress ticks are frequent; skip the formatting when filtered out
+        if not logger.isEnabledFor(self.log_level):
+            return
         logger.log(
-            self.log_level,
-            f"Task {update.task_id}: {update.current_step.value} - "
-            f"{update.progress_percentage:.1f}% - {update.message}"
+            self.log_level, "Task %s: %s - %.1f%% - %s",
+            update.task_id, update.current_step, update.progress_percentage, update.message
         )
     
     async def on_error(self, task_id: str, error: str, step: ProgressStep) -> None:
         """Log error"""
-        logger.error(f"Task {task_id} error at {step.value}: {error}")
+        logger.error("Task %s error at %s: %s", task_id, step, error)
     
     async def on_completion(self, task_id: str, success: bool, final_message: str) -> None:
         """Log completion"""
         level = logging.INFO if success else logging.ERROR
-        logger.log(level, f"Task {task_id} {'completed' if success else 'failed'}: {final_message}")
+        logger.log(level, "Task %s %s: %s", task_id, 'completed' if success else 'failed', final_message)
 
 
 class ProgressTracker:
     """Main progress tracker class"""
     
+    # Step weights, and the weight of all steps before each one, by step ordinal
+    _WEIGHTS: Tuple[int, ...] = (5, 5, 25, 15, 10, 25, 10, 5)
+    _CUM: Tuple[int, ...] = (0, *accumulate(_WEIGHTS[:-1]))
+    _TOTAL = sum(_WEIGHTS)
+    
+    # Minimum seconds between in-progress notifications; later ones are coalesced
+    NOTIFY_INTERVAL = 0.1
+    
     def __init__(self, task_id: str = None):
         self.task_id = task_id or str(uuid4())
         self.callbacks: List[ProgressCallback] = []
+        # Immutable snapshot iterated on every notification
+        self._callbacks: Tuple[ProgressCallback, ...] = ()
         self.current_step = ProgressStep.INITIALIZING
         self.current_item = 0
         self.total_items = 1
         self.progress_percentage = 0.0
         self.status = ProgressStatus.PENDING
         self.start_time = None
-        self.step_weights = {
-            ProgressStep.INITIALIZING: 5,
-            ProgressStep.VALIDATING_URL: 5,
-            ProgressStep.FETCHING_CONTENT: 25,
-            ProgressStep.PARSING_CONTENT: 15,
-            ProgressStep.EXTRACTING_MEDIA: 10,
-            ProgressStep.DOWNLOADING_FILES: 25,
-            ProgressStep.STORING_DATA: 10,
-            ProgressStep.FINALIZING: 5
+        # Monotonic clock at start(), used to measure elapsed_time
+        self._start_monotonic: Optional[float] = None
+        
+        # get_status() snapshot, kept current by each mutator
+        self._status_dict: Dict[str, Any] = {
+            "task_id": self.task_id,
+            "status": self.status.value,
+            "current_step": self.current_step.value,
+            "progress_percentage": self.progress_percentage,
+            "current_item": self.current_item,
+            "total_items": self.total_items,
+            "elapsed_time": 0.0
         }
+        
+        # Coalescing state: when the last notification went out, what it
+        # reported, and the latest message held back since then
+        self._last_notify = 0.0
+        self._last_notified: Optional[Tuple[ProgressStatus, ProgressStep]] = None
+        self._pending_message: Optional[str] = None
+        self._deferred_notify: Optional[asyncio.Task] = None
     
     def add_callback(self, callback: ProgressCallback) -> None:
         """Add a progress callback"""
         self.callbacks.append(callback)
+        self._callbacks = tuple(self.callbacks)
     
     def remove_callback(self, callback: ProgressCallback) -> None:
         """Remove a progress callback"""
         if callback in self.callbacks:
             self.callbacks.remove(callback)
+            self._callbacks = tuple(self.callbacks)
     
     async def start(self, total_items: int = 1) -> None:
         """Start progress tracking"""
@@ -227,6 +370,12 @@ class ProgressTracker:
         self.current_item = 0
         self.status = ProgressStatus.STARTING
         self.start_time = time.time()
+        self._start_monotonic = time.monotonic()
+        self._status_dict.update(
+            status=self.status.value,
+            current_item=self.current_item,
+            total_items=self.total_items
+        )
         
         await self._notify_progress("Starting download operation")
     
@@ -239,8 +388,13 @@ class ProgressTracker:
         # Calculate overall progress based on step weights and item progress
         step_progress = self._calculate_step_progress(step, item_progress)
         self.progress_percentage = min(step_progress, 99.0)  # Cap at 99% until completion
+        self._status_dict.update(
+            status=self.status.value,
+            current_step=self.current_step.value,
+            progress_percentage=self.progress_percentage
+        )
         
-        await self._notify_progress(message or f"Processing {step.value}")
+        await self._notify_progress(message or f"Processing {step}")
     
     async def update_item_progress(self, current_item: int, message: str = "") -> None:
         """Update progress for current item in batch"""
@@ -250,77 +404,132 @@ class ProgressTracker:
         item_progress = (current_item / self.total_items) * 100 if self.total_items > 0 else 0
         step_progress = self._calculate_step_progress(self.current_step, item_progress)
         self.progress_percentage = min(step_progress, 99.0)
+        self._status_dict.update(
+            progress_percentage=self.progress_percentage,
+            current_item=self.current_item
+        )
         
         await self._notify_progress(message or f"Processing item {current_item}/{self.total_items}")
     
     async def report_error(self, error: str, warning: bool = False) -> None:
         """Report an error or warning"""
         if warning:
-            await self._notify_progress(f"Warning: {error}", warning=error)
+            # Warnings go straight out: they neither wait behind nor replace
+            # a coalesced progress notification
+            await self._gather_callbacks(
+                [callback.on_progress_update(self._make_warning_update(error)) for callback in self._callbacks],
+                "Progress callback failed"
+            )
         else:
+            await self.flush()
             self.status = ProgressStatus.FAILED
-            for callback in self.callbacks:
-                await callback.on_error(self.task_id, error, self.current_step)
+            self._status_dict["status"] = self.status.value
+            await self._gather_callbacks(
+                [callback.on_error(self.task_id, error, self.current_step) for callback in self._callbacks],
+                "Error callback failed"
+            )
     
     async def complete(self, success: bool = True, message: str = "") -> None:
         """Mark progress as complete"""
         self.status = ProgressStatus.COMPLETED if success else ProgressStatus.FAILED
         self.progress_percentage = 100.0 if success else self.progress_percentage
+        self._status_dict.update(
+            status=self.status.value,
+            progress_percentage=self.progress_percentage
+        )
         
         final_message = message or ("Download completed successfully" if success else "Download failed")
         
         await self._notify_progress(final_message)
         
-        for callback in self.callbacks:
-            await callback.on_completion(self.task_id, success, final_message)
+        await self._gather_callbacks(
+            [callback.on_completion(self.task_id, success, final_message) for callback in self._callbacks],
+            "Completion callback failed"
+        )
     
     def _calculate_step_progress(self, step: ProgressStep, item_progress: float) -> float:
         """Calculate overall progress based on current step and item progress"""
-        # Get the cumulative weight of completed steps
-        completed_weight = sum(
-            weight for s, weight in self.step_weights.items() 
-            if list(self.step_weights.keys()).index(s) < list(self.step_weights.keys()).index(step)
-        )
-        
-        # Get current step weight and progress within step
-        current_step_weight = self.step_weights[step]
-        step_progress = (item_progress / 100) * current_step_weight
-        
-        # Calculate total progress
-        total_weight = sum(self.step_weights.values())
-        overall_progress = ((completed_weight + step_progress) / total_weight) * 100
+        # Weight of the completed steps plus progress within the current step
+        i = _STEP_ORDINAL[step]
+        step_progress = (item_progress / 100) * self._WEIGHTS[i]
+        overall_progress = ((self._CUM[i] + step_progress) / self._TOTAL) * 100
         
         return overall_progress
     
-    async def _notify_progress(self, message: str, warning: str = None) -> None:
-        """Notify all callbacks of progress update"""
-        update = ProgressUpdate(
+    def _make_warning_update(self, warning: str) -> ProgressUpdate:
+        """Build an update carrying a warning at the current progress"""
+        return ProgressUpdate(
             task_id=self.task_id,
             status=self.status,
             current_step=self.current_step,
             progress_percentage=self.progress_percentage,
-            message=message,
+            message=f"Warning: {warning}",
             current_item=self.current_item,
             total_items=self.total_items,
             warning=warning
         )
+    
+    async def flush(self) -> None:
+        """Deliver any coalesced progress notification now"""
+        if self._pending_message is not None:
+            await self._deliver_progress(self._pending_message)
+    
+    async def _notify_progress(self, message: str) -> None:
+        """Notify all callbacks of progress update, coalescing rapid in-progress updates"""
+        now = time.monotonic()
+        if (self.status == ProgressStatus.IN_PROGRESS
+                and self._last_notified == (self.status, self.current_step)
+                and now - self._last_notify < self.NOTIFY_INTERVAL):
+            self._pending_message = message
+            if self._deferred_notify is None:
+                self._deferred_notify = asyncio.create_task(
+                    self._notify_after(self._last_notify + self.NOTIFY_INTERVAL - now)
+                )
+            return
+        
+        await self._deliver_progress(message)
+    
+    async def _notify_after(self, delay: float) -> None:
+        """Deliver the latest coalesced notification once the interval has passed"""
+        await asyncio.sleep(delay)
+        self._deferred_notify = None
+        await self.flush()
+    
+    async def _deliver_progress(self, message: str) -> None:
+        """Send the current state to all callbacks"""
+        # This notification supersedes anything held back
+        self._pending_message = None
+        if self._deferred_notify is not None:
+            self._deferred_notify.cancel()
+        self._deferred_notify = None
+        self._last_notify = time.monotonic()
+        self._last_notified = (self.status, self.current_step)
+        
+        update = ProgressUpdate(
+            task_id=self.task_id,
+            status=self.status,
+            current_step=self.current_step,
+            progress_percentage=self.progress_percentage,
+            message=message,
+            current_item=self.current_item,
+            total_items=self.total_items
+        )
         
-        for callback in self.callbacks:
-            try:
-                await callback.on_progress_update(update)
-            except Exception as e:
-                logger.error(f"Progress callback failed: {e}")
+        await self._gather_callbacks(
+            [callback.on_progress_update(update) for callback in self._callbacks],
+            "Progress callback failed"
+        )
+    
+    async def _gather_callbacks(self, coros: List[Awaitable[None]], failure_message: str) -> None:
+        """Run callback coroutines concurrently, logging any that fail"""
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"{failure_message}: {result}")
     
     def get_status(self) -> Dict[str, Any]:
         """Get current status as dictionary"""
-        elapsed_time = time.time() - self.start_time if self.start_time else 0
-        
-        return {
-            "task_id": self.task_id,
-            "status": self.status.value,
-            "current_step": self.current_step.value,
-            "progress_percentage": self.progress_percentage,
-            "current_item": self.current_item,
-            "total_items": self.total_items,
-            "elapsed_time": elapsed_time
-        } 
\ No newline at end of file
+        self._status_dict["elapsed_time"] = (
+            time.monotonic() - self._start_monotonic if self._start_monotonic is not None else 0
+        )
+        return dict(self._status_dict) 
\ No newline at end of file
@@ -3,7 +3,9 @@ Rate Limiter - Controls request frequency to avoid being blocked
 """
 
 import asyncio
+import sys
 import time
+from collections import deque
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
@@ -27,17 +29,28 @@ class RateLimiter:
         self.window_size = window_size
         
         self.last_request_time = 0.0
-        self.request_times: list = []
+        self.request_times: deque = deque(maxlen=burst_limit + 1)
         self._lock = asyncio.Lock()
         
     async def wait(self):
         """Wait for the appropriate amount of time before making a request"""
+        # Fast path: with nobody queued and neither limit reached, record the
+        # request without taking the lock. Nothing here awaits, so no other
+        # coroutine can run between the check and the record.
+        current_time = time.monotonic()
+        if not self._lock.locked():
+            self._prune(current_time)
+            if (len(self.request_times) < self.burst_limit and
+                    current_time - self.last_request_time >= self.delay):
+                self.last_request_time = current_time
+                self.request_times.append(current_time)
+                return
+                
         async with self._lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Clean old request times outside the window
-            cutoff_time = current_time - self.window_size
-            self.request_times = [t for t in self.request_times if t > cutoff_time]
+            self._prune(current_time)
             
             # Check burst limit
             if len(self.request_times) >= self.burst_limit:
@@ -45,33 +58,40 @@ class RateLimiter:
                 wait_time = self.request_times[0] + self.window_size - current_time + 0.1
                 if wait_time > 0:
                     await asyncio.sleep(wait_time)
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     
             # Check minimum delay
             time_since_last = current_time - self.last_request_time
             if time_since_last < self.delay:
                 wait_time = self.delay - time_since_last
                 await asyncio.sleep(wait_time)
-                current_time = time.time()
+                current_time = time.monotonic()
                 
             # Record this request
             self.last_request_time = current_time
             self.request_times.append(current_time)
             
+    def _prune(self, current_time: float):
+        """Drop request times that have fallen out of the window"""
+        cutoff_time = current_time - self.window_size
+        request_times = self.request_times
+        while request_times and request_times[0] <= cutoff_time:
+            request_times.popleft()
+            
     def get_stats(self) -> Dict[str, any]:
         """Get rate limiter statistics"""
-        current_time = time.time()
-        cutoff_time = current_time - self.window_size
-        recent_requests = [t for t in self.request_times if t > cutoff_time]
+        current_time = time.monotonic()
+        self._prune(current_time)
+        recent_requests = len(self.request_times)
         
         return {
             'delay': self.delay,
             'burst_limit': self.burst_limit,
             'window_size': self.window_size,
-            'requests_in_window': len(recent_requests),
+            'requests_in_window': recent_requests,
             'time_since_last_request': current_time - self.last_request_time,
             'can_make_request_now': (
-                len(recent_requests) < self.burst_limit and 
+                recent_requests < self.burst_limit and 
                 (current_time - self.last_request_time) >= self.delay
             )
         }
@@ -82,6 +102,75 @@ class RateLimiter:
         self.request_times.clear()
 
 
+class TokenBucketRateLimiter:
+    """
+    Token-bucket rate limiter that allows short bursts
+    
+    Up to `burst` requests may go out back to back; after that, requests are
+    released at the long-term average rate of `burst` per `window` seconds.
+    Can be used as `await limiter.wait()` or `async with limiter:`.
+    """
+    
+    def __init__(self, burst: int = 10, window: float = 10.0):
+        """
+        Initialize token-bucket rate limiter
+        
+        Args:
+            burst: Bucket capacity, i.e. the number of requests allowed at once
+            window: Time in seconds to refill a full bucket; 0 disables limiting
+        """
+        self.burst = burst
+        self.window = window
+        self.rate = burst / window if window > 0 else 0.0
+        
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+    def _refill(self, now: float):
+        """Add the tokens accumulated since the last refill"""
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        
+    async def wait(self):
+        """Take a token, waiting for the bucket to refill if it is empty"""
+        if self.rate <= 0:
+            return
+            
+        async with self._lock:
+            self._refill(time.monotonic())
+            
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill(time.monotonic())
+                
+            self.tokens -= 1
+            
+    async def __aenter__(self):
+        await self.wait()
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+        
+    def get_stats(self) -> Dict[str, any]:
+        """Get rate limiter statistics"""
+        if self.rate > 0:
+            self._refill(time.monotonic())
+            
+        return {
+            'burst': self.burst,
+            'window': self.window,
+            'tokens_available': self.tokens,
+            'can_make_request_now': self.rate <= 0 or self.tokens >= 1
+        }
+        
+    def reset(self):
+        """Reset the rate limiter to a full bucket"""
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+
+
 class PlatformRateLimiter:
     """
     Manages rate limiters for different platforms
@@ -91,23 +180,25 @@ class PlatformRateLimiter:
         self.limiters: Dict[str, RateLimiter] = {}
         
         # Default configurations for different platforms
-        self.default_configs = {
+        self.default_configs = {sys.intern(platform): config for platform, config in {
             'youtube': {'delay': 1.0, 'burst_limit': 10, 'window_size': 60},
             'instagram': {'delay': 3.0, 'burst_limit': 5, 'window_size': 120},
             'threads': {'delay': 2.0, 'burst_limit': 8, 'window_size': 90},
             'rednote': {'delay': 4.0, 'burst_limit': 3, 'window_size': 180},
             'default': {'delay': 2.0, 'burst_limit': 5, 'window_size': 60}
-        }
+        }.items()}
         
     def get_limiter(self, platform: str) -> RateLimiter:
         """Get or create a rate limiter for a platform"""
-        platform = platform.lower()
+        platform = sys.intern(platform.lower())
         
-        if platform not in self.limiters:
-            config = self.default_configs.get(platform, self.default_configs['default'])
-            self.limiters[platform] = RateLimiter(**config)
-            
-        return self.limiters[platform]
+        # The hot path is a single dict probe. On a miss, setdefault returns
+        # whichever limiter was stored first, so every caller shares one per
+        # platform. Limiters hold asyncio locks and belong to a single event
+        # loop; they aren't shared across threads.
+        return self.limiters.get(platform) or self.limiters.setdefault(
+            platform, RateLimiter(**self.default_configs.get(platform, self.default_configs['default']))
+        )
         
     async def wait_for_platform(self, platform: str):
         """Wait for the appropriate rate limit for a platform"""
@@ -3,7 +3,10 @@ Recommendation Engine Module
 Generates actionable recommendations based on identified success patterns.
 """
 
+import heapq
 import logging
+from dataclasses import dataclass
+from operator import itemgetter
 from typing import Dict, List, Optional, Any, Union, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -15,6 +18,9 @@ from analytics.pattern_recognizer import PatternRecognizer
 
 logger = logging.getLogger(__name__)
 
+# Details used when nothing platform- or content-type-specific applies
+DEFAULT_DETAILS = "Analyze your best-performing content for specific implementation details."
+
 
 class RecommendationType:
     """Enum-like class for recommendation types"""
@@ -26,6 +32,330 @@ class RecommendationType:
     PLATFORM_SPECIFIC = "platform_specific"
 
 
+@dataclass(frozen=True, slots=True)
+class RecommendationTemplate:
+    """A recommendation template, pre-split around its {details} placeholder"""
+    type: str
+    prefix: str
+    suffix: str
+    impact_score: int
+    platform_specific: bool
+    content_type_specific: bool
+    
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> "RecommendationTemplate":
+        """Build a template from its table entry"""
+        prefix, _, suffix = spec["template"].partition("{details}")
+        return cls(
+            type=spec["type"],
+            prefix=prefix,
+            suffix=suffix,
+            impact_score=spec["impact_score"],
+            platform_specific=spec["platform_specific"],
+            content_type_specific=spec["content_type_specific"]
+        )
+
+
+@dataclass(slots=True)
+class Recommendation:
+    """A generated recommendation, serialized with to_dict() by the API layer"""
+    id: str
+    type: str
+    text: str
+    impact_score: int
+    source_pattern: str
+    pattern_confidence: float
+    created_at: str
+    platform_specific: bool
+    content_type_specific: bool
+    platform: Optional[str]
+    content_type: Optional[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form returned by the API"""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "text": self.text,
+            "impact_score": self.impact_score,
+            "source_pattern": self.source_pattern,
+            "pattern_confidence": self.pattern_confidence,
+            "created_at": self.created_at,
+            "platform_specific": self.platform_specific,
+            "content_type_specific": self.content_type_specific,
+            "platform": self.platform,
+            "content_type": self.content_type
+        }
+
+
+# Templates for generating recommendations from patterns
+_TEMPLATE_SPECS = {
+    # NLP-based pattern recommendations
+    "positive_sentiment": {
+        "type": RecommendationType.TEXT_ELEMENTS,
+        "template": "Use positive language in your content. {details}",
+        "impact_score": 8,
+        "platform_specific": False,
+        "content_type_specific": False
+    },
+    "high_readability": {
+        "type": RecommendationType.TEXT_ELEMENTS,
+        "template": "Keep your text simple and readable. {details}",
+        "impact_score": 7,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+    "topic_relevance": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Focus on topics relevant to your audience: {details}",
+        "impact_score": 9,
+        "platform_specific": True,
+        "content_type_specific": False
+    },
+    "keyword_optimized": {
+        "type": RecommendationType.TEXT_ELEMENTS,
+        "template": "Include these high-performing keywords: {details}",
+        "impact_score": 8,
+        "platform_specific": True,
+        "content_type_specific": False
+    },
+    "emotional_triggers": {
+        "type": RecommendationType.TEXT_ELEMENTS,
+        "template": "Use emotional language that resonates with your audience. {details}",
+        "impact_score": 8,
+        "platform_specific": False,
+        "content_type_specific": False
+    },
+
+    # CV-based pattern recommendations
+    "visual_appeal": {
+        "type": RecommendationType.VISUAL_ELEMENTS,
+        "template": "Create visually appealing content with {details}",
+        "impact_score": 8,
+        "platform_specific": True,
+        "content_type_specific": True
+    },
+    "human_presence": {
+        "type": RecommendationType.VISUAL_ELEMENTS,
+        "template": "Include human faces or people in your visuals. {details}",
+        "impact_score": 9,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+    "color_harmony": {
+        "type": RecommendationType.VISUAL_ELEMENTS,
+        "template": "Use harmonious color schemes: {details}",
+        "impact_score": 7,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+    "scene_relevance": {
+        "type": RecommendationType.VISUAL_ELEMENTS,
+        "template": "Ensure visual scenes are relevant to your message. {details}",
+        "impact_score": 8,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+
+    # Combined NLP+CV pattern recommendations
+    "emotional_visual_harmony": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Match emotional tone in text with visual elements. {details}",
+        "impact_score": 9,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+    "storytelling_excellence": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Tell a compelling story across text and visuals. {details}",
+        "impact_score": 9,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+    "topic_scene_alignment": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Align discussed topics with visual scenes. {details}",
+        "impact_score": 8,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+    "personality_showcase": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Showcase personality through both text and visuals. {details}",
+        "impact_score": 8,
+        "platform_specific": True,
+        "content_type_specific": False
+    },
+    "visual_text_contrast": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Create intentional contrast between text and visuals. {details}",
+        "impact_score": 7,
+        "platform_specific": False,
+        "content_type_specific": True
+    },
+
+    # Temporal pattern recommendations
+    "optimal_posting_time": {
+        "type": RecommendationType.POSTING_STRATEGY,
+        "template": "Post content during optimal engagement hours: {details}",
+        "impact_score": 8,
+        "platform_specific": True,
+        "content_type_specific": False
+    },
+    "weekend_success": {
+        "type": RecommendationType.POSTING_STRATEGY,
+        "template": "Consider posting content on weekends. {details}",
+        "impact_score": 7,
+        "platform_specific": True,
+        "content_type_specific": False
+    },
+    "rapid_growth": {
+        "type": RecommendationType.ENGAGEMENT_STRATEGY,
+        "template": "Optimize for rapid engagement growth by {details}",
+        "impact_score": 9,
+        "platform_specific": True,
+        "content_type_specific": False
+    },
+
+    # Content type specific recommendations
+    "successful_video": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Create video content with these characteristics: {details}",
+        "impact_score": 8,
+        "platform_specific": True,
+        "content_type_specific": True
+    },
+    "successful_image": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Create image content with these characteristics: {details}",
+        "impact_score": 8,
+        "platform_specific": True,
+        "content_type_specific": True
+    },
+    "successful_text": {
+        "type": RecommendationType.CONTENT_CREATION,
+        "template": "Create text content with these characteristics: {details}",
+        "impact_score": 8,
+        "platform_specific": True,
+        "content_type_specific": True
+    }
+}
+
+_RECOMMENDATION_TEMPLATES = {
+    pattern_name: RecommendationTemplate.from_spec(spec)
+    for pattern_name, spec in _TEMPLATE_SPECS.items()
+}
+
+# Platform-specific recommendation details
+_PLATFORM_DETAILS = {
+    PlatformType.YOUTUBE: {
+        "positive_sentiment": "Focus on enthusiastic language and upbeat tone.",
+        "topic_relevance": "trending topics in your niche on YouTube",
+        "keyword_optimized": "research-backed YouTube SEO keywords",
+        "visual_appeal": "high-quality thumbnails and video quality",
+        "personality_showcase": "consistent on-camera personality",
+        "optimal_posting_time": "typically weekday evenings",
+        "rapid_growth": "responding to comments in the first hour",
+        "successful_video": "clear intro, engaging thumbnails, and strong calls to action"
+    },
+    PlatformType.INSTAGRAM: {
+        "positive_sentiment": "Use aspirational and inspirational language.",
+        "topic_relevance": "visually-oriented trending topics",
+        "keyword_optimized": "relevant hashtags (7-12 per post)",
+        "visual_appeal": "high-contrast, well-composed images",
+        "personality_showcase": "consistent visual aesthetic and voice",
+        "optimal_posting_time": "typically 10-11am or 7-9pm",
+        "rapid_growth": "engaging with similar content before posting",
+        "successful_image": "high-quality images with strong focal points"
+    },
+    PlatformType.THREADS: {
+        "positive_sentiment": "Mix positivity with authenticity and humor.",
+        "topic_relevance": "current conversations in your niche",
+        "keyword_optimized": "trending topics and conversational keywords",
+        "visual_appeal": "clean, simple visuals that complement text",
+        "personality_showcase": "distinctive voice and perspective",
+        "optimal_posting_time": "typically midday and early evening",
+        "rapid_growth": "joining active conversations with valuable insights",
+        "successful_text": "concise, conversation-starting text with personality"
+    },
+    PlatformType.REDNOTE: {
+        "positive_sentiment": "Combine positivity with authentic expression.",
+        "topic_relevance": "music and culture-focused topics",
+        "keyword_optimized": "music-related keywords and artist references",
+        "visual_appeal": "vibrant, music-culture aligned visuals",
+        "personality_showcase": "unique artistic perspective",
+        "optimal_posting_time": "typically evenings and late night",
+        "rapid_growth": "collaborating with other creators",
+        "successful_video": "short, music-focused clips with strong visual identity"
+    }
+}
+
+# Content type specific recommendation details
+_CONTENT_TYPE_DETAILS = {
+    ContentType.VIDEO: {
+        "high_readability": "Use clear, concise scripts with short sentences.",
+        "visual_appeal": "good lighting, composition, and movement",
+        "human_presence": "feature people prominently, especially in thumbnails",
+        "color_harmony": "consistent color grading throughout",
+        "scene_relevance": "scenes that clearly illustrate your points",
+        "emotional_visual_harmony": "matching music and visuals to the emotional tone",
+        "storytelling_excellence": "clear narrative arc with beginning, middle, and end",
+        "topic_scene_alignment": "visuals that directly support each talking point",
+        "visual_text_contrast": "readable on-screen text with good contrast"
+    },
+    ContentType.IMAGE: {
+        "high_readability": "Limit text overlay to essential points with clear fonts.",
+        "visual_appeal": "strong composition following rule of thirds",
+        "human_presence": "authentic human expressions and interactions",
+        "color_harmony": "cohesive color palette with 2-3 main colors",
+        "scene_relevance": "imagery that directly conveys your message",
+        "emotional_visual_harmony": "visual tone matching caption emotion",
+        "storytelling_excellence": "images that imply a narrative",
+        "topic_scene_alignment": "visuals directly illustrating caption topics",
+        "visual_text_contrast": "text overlay with strong contrast against background"
+    },
+    ContentType.TEXT: {
+        "high_readability": "Short paragraphs, simple words, and clear structure.",
+        "visual_appeal": "clean formatting with appropriate spacing",
+        "human_presence": "personal stories or perspectives",
+        "storytelling_excellence": "narrative structure with clear flow",
+        "topic_scene_alignment": "examples that vividly illustrate concepts"
+    },
+    ContentType.MIXED: {
+        "high_readability": "Balance text and visuals, with each enhancing the other.",
+        "visual_appeal": "cohesive design across text and visual elements",
+        "human_presence": "human elements in both text and visuals",
+        "color_harmony": "consistent color theme across all elements",
+        "scene_relevance": "visuals that enhance rather than distract from text",
+        "emotional_visual_harmony": "consistent emotional tone across elements",
+        "storytelling_excellence": "complementary storytelling across formats",
+        "topic_scene_alignment": "tight integration of topics across formats",
+        "visual_text_contrast": "clear distinction between text and visual elements"
+    }
+}
+
+
+def _build_details_cache() -> Dict[Tuple[Optional[PlatformType], Optional[ContentType]], Dict[str, str]]:
+    """Combine the details text for every (platform, content type, pattern)"""
+    cache = {}
+    for platform in (None, *PlatformType):
+        platform_details = _PLATFORM_DETAILS.get(platform, {})
+        for content_type in (None, *ContentType):
+            content_details = _CONTENT_TYPE_DETAILS.get(content_type, {})
+            cache[(platform, content_type)] = {
+                pattern_name: " ".join(filter(None, (
+                    platform_details.get(pattern_name),
+                    content_details.get(pattern_name)
+                ))) or DEFAULT_DETAILS
+                for pattern_name in _RECOMMENDATION_TEMPLATES
+            }
+    return cache
+
+
+# Built once at import; every engine shares it
+_DETAILS_CACHE = _build_details_cache()
+
+
 class RecommendationEngine:
     """
     Engine for generating actionable recommendations based on identified success patterns
@@ -40,245 +370,11 @@ class RecommendationEngine:
     
     def _initialize_recommendation_templates(self):
         """Initialize templates for generating recommendations from patterns"""
-        self.recommendation_templates = {
-            # NLP-based pattern recommendations
-            "positive_sentiment": {
-                "type": RecommendationType.TEXT_ELEMENTS,
-                "template": "Use positive language in your content. {details}",
-                "impact_score": 8,
-                "platform_specific": False,
-                "content_type_specific": False
-            },
-            "high_readability": {
-                "type": RecommendationType.TEXT_ELEMENTS,
-                "template": "Keep your text simple and readable. {details}",
-                "impact_score": 7,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            "topic_relevance": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Focus on topics relevant to your audience: {details}",
-                "impact_score": 9,
-                "platform_specific": True,
-                "content_type_specific": False
-            },
-            "keyword_optimized": {
-                "type": RecommendationType.TEXT_ELEMENTS,
-                "template": "Include these high-performing keywords: {details}",
-                "impact_score": 8,
-                "platform_specific": True,
-                "content_type_specific": False
-            },
-            "emotional_triggers": {
-                "type": RecommendationType.TEXT_ELEMENTS,
-                "template": "Use emotional language that resonates with your audience. {details}",
-                "impact_score": 8,
-                "platform_specific": False,
-                "content_type_specific": False
-            },
-            
-            # CV-based pattern recommendations
-            "visual_appeal": {
-                "type": RecommendationType.VISUAL_ELEMENTS,
-                "template": "Create visually appealing content with {details}",
-                "impact_score": 8,
-                "platform_specific": True,
-                "content_type_specific": True
-            },
-            "human_presence": {
-                "type": RecommendationType.VISUAL_ELEMENTS,
-                "template": "Include human faces or people in your visuals. {details}",
-                "impact_score": 9,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            "color_harmony": {
-                "type": RecommendationType.VISUAL_ELEMENTS,
-                "template": "Use harmonious color schemes: {details}",
-                "impact_score": 7,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            "scene_relevance": {
-                "type": RecommendationType.VISUAL_ELEMENTS,
-                "template": "Ensure visual scenes are relevant to your message. {details}",
-                "impact_score": 8,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            
-            # Combined NLP+CV pattern recommendations
-            "emotional_visual_harmony": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Match emotional tone in text with visual elements. {details}",
-                "impact_score": 9,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            "storytelling_excellence": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Tell a compelling story across text and visuals. {details}",
-                "impact_score": 9,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            "topic_scene_alignment": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Align discussed topics with visual scenes. {details}",
-                "impact_score": 8,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            "personality_showcase": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Showcase personality through both text and visuals. {details}",
-                "impact_score": 8,
-                "platform_specific": True,
-                "content_type_specific": False
-            },
-            "visual_text_contrast": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Create intentional contrast between text and visuals. {details}",
-                "impact_score": 7,
-                "platform_specific": False,
-                "content_type_specific": True
-            },
-            
-            # Temporal pattern recommendations
-            "optimal_posting_time": {
-                "type": RecommendationType.POSTING_STRATEGY,
-                "template": "Post content during optimal engagement hours: {details}",
-                "impact_score": 8,
-                "platform_specific": True,
-                "content_type_specific": False
-            },
-            "weekend_success": {
-                "type": RecommendationType.POSTING_STRATEGY,
-                "template": "Consider posting content on weekends. {details}",
-                "impact_score": 7,
-                "platform_specific": True,
-                "content_type_specific": False
-            },
-            "rapid_growth": {
-                "type": RecommendationType.ENGAGEMENT_STRATEGY,
-                "template": "Optimize for rapid engagement growth by {details}",
-                "impact_score": 9,
-                "platform_specific": True,
-                "content_type_specific": False
-            },
-            
-            # Content type specific recommendations
-            "successful_video": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Create video content with these characteristics: {details}",
-                "impact_score": 8,
-                "platform_specific": True,
-                "content_type_specific": True
-            },
-            "successful_image": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Create image content with these characteristics: {details}",
-                "impact_score": 8,
-                "platform_specific": True,
-                "content_type_specific": True
-            },
-            "successful_text": {
-                "type": RecommendationType.CONTENT_CREATION,
-                "template": "Create text content with these characteristics: {details}",
-                "impact_score": 8,
-                "platform_specific": True,
-                "content_type_specific": True
-            }
-        }
-        
-        # Platform-specific recommendation details
-        self.platform_details = {
-            PlatformType.YOUTUBE: {
-                "positive_sentiment": "Focus on enthusiastic language and upbeat tone.",
-                "topic_relevance": "trending topics in your niche on YouTube",
-                "keyword_optimized": "research-backed YouTube SEO keywords",
-                "visual_appeal": "high-quality thumbnails and video quality",
-                "personality_showcase": "consistent on-camera personality",
-                "optimal_posting_time": "typically weekday evenings",
-                "rapid_growth": "responding to comments in the first hour",
-                "successful_video": "clear intro, engaging thumbnails, and strong calls to action"
-            },
-            PlatformType.INSTAGRAM: {
-                "positive_sentiment": "Use aspirational and inspirational language.",
-                "topic_relevance": "visually-oriented trending topics",
-                "keyword_optimized": "relevant hashtags (7-12 per post)",
-                "visual_appeal": "high-contrast, well-composed images",
-                "personality_showcase": "consistent visual aesthetic and voice",
-                "optimal_posting_time": "typically 10-11am or 7-9pm",
-                "rapid_growth": "engaging with similar content before posting",
-                "successful_image": "high-quality images with strong focal points"
-            },
-            PlatformType.THREADS: {
-                "positive_sentiment": "Mix positivity with authenticity and humor.",
-                "topic_relevance": "current conversations in your niche",
-                "keyword_optimized": "trending topics and conversational keywords",
-                "visual_appeal": "clean, simple visuals that complement text",
-                "personality_showcase": "distinctive voice and perspective",
-                "optimal_posting_time": "typically midday and early evening",
-                "rapid_growth": "joining active conversations with valuable insights",
-                "successful_text": "concise, conversation-starting text with personality"
-            },
-            PlatformType.REDNOTE: {
-                "positive_sentiment": "Combine positivity with authentic expression.",
-                "topic_relevance": "music and culture-focused topics",
-                "keyword_optimized": "music-related keywords and artist references",
-                "visual_appeal": "vibrant, music-culture aligned visuals",
-                "personality_showcase": "unique artistic perspective",
-                "optimal_posting_time": "typically evenings and late night",
-                "rapid_growth": "collaborating with other creators",
-                "successful_video": "short, music-focused clips with strong visual identity"
-            }
-        }
-        
-        # Content type specific recommendation details
-        self.content_type_details = {
-            ContentType.VIDEO: {
-                "high_readability": "Use clear, concise scripts with short sentences.",
-                "visual_appeal": "good lighting, composition, and movement",
-                "human_presence": "feature people prominently, especially in thumbnails",
-                "color_harmony": "consistent color grading throughout",
-                "scene_relevance": "scenes that clearly illustrate your points",
-                "emotional_visual_harmony": "matching music and visuals to the emotional tone",
-                "storytelling_excellence": "clear narrative arc with beginning, middle, and end",
-                "topic_scene_alignment": "visuals that directly support each talking point",
-                "visual_text_contrast": "readable on-screen text with good contrast"
-            },
-            ContentType.IMAGE: {
-                "high_readability": "Limit text overlay to essential points with clear fonts.",
-                "visual_appeal": "strong composition following rule of thirds",
-                "human_presence": "authentic human expressions and interactions",
-                "color_harmony": "cohesive color palette with 2-3 main colors",
-                "scene_relevance": "imagery that directly conveys your message",
-                "emotional_visual_harmony": "visual tone matching caption emotion",
-                "storytelling_excellence": "images that imply a narrative",
-                "topic_scene_alignment": "visuals directly illustrating caption topics",
-                "visual_text_contrast": "text overlay with strong contrast against background"
-            },
-            ContentType.TEXT: {
-                "high_readability": "Short paragraphs, simple words, and clear structure.",
-                "visual_appeal": "clean formatting with appropriate spacing",
-                "human_presence": "personal stories or perspectives",
-                "storytelling_excellence": "narrative structure with clear flow",
-                "topic_scene_alignment": "examples that vividly illustrate concepts"
-            },
-            ContentType.MIXED: {
-                "high_readability": "Balance text and visuals, with each enhancing the other.",
-                "visual_appeal": "cohesive design across text and visual elements",
-                "human_presence": "human elements in both text and visuals",
-                "color_harmony": "consistent color theme across all elements",
-                "scene_relevance": "visuals that enhance rather than distract from text",
-                "emotional_visual_harmony": "consistent emotional tone across elements",
-                "storytelling_excellence": "complementary storytelling across formats",
-                "topic_scene_alignment": "tight integration of topics across formats",
-                "visual_text_contrast": "clear distinction between text and visual elements"
-            }
-        }
+        # The tables are static, so every engine shares the module-level ones
+        self.recommendation_templates: Dict[str, RecommendationTemplate] = _RECOMMENDATION_TEMPLATES
+        self.platform_details = _PLATFORM_DETAILS
+        self.content_type_details = _CONTENT_TYPE_DETAILS
+        self._details_cache = _DETAILS_CACHE
     
     def generate_recommendations(
         self,
@@ -286,7 +382,7 @@ class RecommendationEngine:
         platform: Optional[PlatformType] = None,
         content_type: Optional[ContentType] = None,
         limit: int = 5
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Recommendation]:
         """
         Generate actionable recommendations based on identified success patterns
         
@@ -297,51 +393,53 @@ class RecommendationEngine:
             limit: Maximum number of recommendations to return
             
         Returns:
-            List of recommendation dictionaries
+            List of recommendations
         """
-        recommendations = []
-        
-        # Process each pattern to generate recommendations
+        # (score, pattern name, template, confidence) for each pattern that applies
+        candidates: List[Tuple[float, str, RecommendationTemplate, float]] = []
         for pattern_name, pattern_data in patterns.items():
-            if pattern_name not in self.recommendation_templates:
+            template = self.recommendation_templates.get(pattern_name)
+            if template is None:
                 continue
-                
-            template = self.recommendation_templates[pattern_name]
-            details = self._get_recommendation_details(pattern_name, platform, content_type)
             
             # Skip if this is a platform-specific recommendation but no platform provided
-            if template["platform_specific"] and not platform:
+            if template.platform_specific and not platform:
                 continue
                 
             # Skip if this is a content-type-specific recommendation but no content type provided
-            if template["content_type_specific"] and not content_type:
+            if template.content_type_specific and not content_type:
                 continue
             
-            # Create recommendation
-            recommendation = {
-                "id": f"rec_{pattern_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                "type": template["type"],
-                "text": template["template"].format(details=details),
-                "impact_score": template["impact_score"],
-                "source_pattern": pattern_name,
-                "pattern_confidence": pattern_data.get("confidence", 0.7),
-                "created_at": datetime.now().isoformat(),
-                "platform_specific": template["platform_specific"],
-                "content_type_specific": template["content_type_specific"],
-                "platform": platform.value if platform else None,
-                "content_type": content_type.value if content_type else None
-            }
-            
-            recommendations.append(recommendation)
+            # Rank by impact score weighted by pattern confidence
+            confidence = pattern_data.get("confidence", 0.7)
+            candidates.append((template.impact_score * confidence, pattern_name, template, confidence))
         
-        # Sort by impact score and pattern confidence
-        recommendations.sort(
-            key=lambda x: (x["impact_score"] * x["pattern_confidence"]),
-            reverse=True
-        )
+        # Values shared by every recommendation in this batch
+        now = datetime.now()
+        id_suffix = now.strftime('%Y%m%d%H%M%S')
+        created_at = now.isoformat()
+        platform_value = platform.value if platform else None
+        content_type_value = content_type.value if content_type else None
         
-        # Return limited number of recommendations
-        return recommendations[:limit]
+        # Build recommendations only for the highest-scoring patterns
+        recommendations: List[Recommendation] = []
+        for _, pattern_name, template, confidence in heapq.nlargest(limit, candidates, key=itemgetter(0)):
+            details = self._get_recommendation_details(pattern_name, platform, content_type)
+            recommendations.append(Recommendation(
+                id=f"rec_{pattern_name}_{id_suffix}",
+                type=template.type,
+                text=template.prefix + details + template.suffix,
+                impact_score=template.impact_score,
+                source_pattern=pattern_name,
+                pattern_confidence=confidence,
+                created_at=created_at,
+                platform_specific=template.platform_specific,
+                content_type_specific=template.content_type_specific,
+                platform=platform_value,
+                content_type=content_type_value
+            ))
+        
+        return recommendations
     
     def _get_recommendation_details(
         self,
@@ -360,24 +458,7 @@ class RecommendationEngine:
         Returns:
             String with detailed recommendation text
         """
-        details = []
-        
-        # Add platform-specific details if available
-        if platform and platform in self.platform_details:
-            platform_details = self.platform_details[platform]
-            if pattern_name in platform_details:
-                details.append(platform_details[pattern_name])
-        
-        # Add content-type-specific details if available
-        if content_type and content_type in self.content_type_details:
-            content_details = self.content_type_details[content_type]
-            if pattern_name in content_details:
-                details.append(content_details[pattern_name])
-        
-        # Return combined details or generic message
-        if details:
-            return " ".join(details)
-        return "Analyze your best-performing content for specific implementation details."
+        return self._details_cache.get((platform, content_type), {}).get(pattern_name, DEFAULT_DETAILS)
     
     def get_recommendations_for_post(
         self,
@@ -542,7 +623,7 @@ class RecommendationEngine:
         # Filter by type
         filtered_recommendations = [
             rec for rec in result["recommendations"]
-            if rec["type"] == recommendation_type
+            if rec.type == recommendation_type
         ]
         
         return {
@@ -421,6 +421,50 @@ class AntiDetectionScraper:
             logger.error(f"Error getting page {url}: {str(e)}")
             raise
             
+    async def get_meta_batch(self, properties: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Read the content of several <meta property=...> tags in one round trip
+        
+        Only the requested attribute values cross the driver boundary, not
+        the full page source.
+        
+        Args:
+            properties: Meta property names, e.g. 'og:title'
+            
+        Returns:
+            Mapping of property name to its content, or None if the tag is missing
+        """
+        if not self.driver:
+            await self.create_driver()
+            
+        # Run the blocking WebDriver call in a thread so concurrent queries
+        # can be issued together without stalling the event loop
+        return await asyncio.to_thread(
+            self.driver.execute_script,
+            "return Object.fromEntries(arguments[0].map(p => {"
+            "  const el = document.querySelector(`meta[property='${p}']`);"
+            "  return [p, el ? el.getAttribute('content') : null];"
+            "}));",
+            list(properties)
+        )
+        
+    async def page_contains_text(self, text: str) -> bool:
+        """
+        Check whether the page's visible text contains text (case-insensitive)
+        
+        The search runs in the browser, so only a boolean is returned.
+        """
+        if not self.driver:
+            await self.create_driver()
+            
+        found = await asyncio.to_thread(
+            self.driver.execute_script,
+            "return !!document.body && "
+            "document.body.innerText.toLowerCase().includes(arguments[0].toLowerCase());",
+            text
+        )
+        return bool(found)
+        
     def quit(self):
         """Clean up driver resources"""
         if self.driver:
@@ -104,6 +104,20 @@ def test_analyze_colors(sample_image):
     # Check that the brightness is reasonable (0-255)
     assert 0 <= colors["brightness"] <= 255
 
+def test_analyze_colors_batch(sample_image):
+    """Test batched color analysis matches single-image analysis"""
+    img = cv2.imread(sample_image)
+    small = cv2.resize(img, (50, 50))
+    
+    results = cv_service.analyze_colors_batch([img, small])
+    
+    assert len(results) == 2
+    single = cv_service.analyze_colors(sample_image)
+    assert np.allclose(results[0]["mean_color"], single["mean_color"], atol=1e-3)
+    assert np.allclose(results[0]["std_color"], single["std_color"], atol=1e-3)
+    assert results[0]["brightness"] == single["brightness"]
+    assert len(results[1]["dominant_colors"]) > 0
+
 def test_analyze_image(sample_image):
     """Test comprehensive image analysis"""
     # Analyze image
@@ -18,7 +18,7 @@ class TestInstagramDownloader:
     @pytest.fixture
     def downloader(self):
         """Create Instagram downloader instance for testing"""
-        return InstagramDownloader(download_dir="test_downloads", rate_limit=0.1)
+        return InstagramDownloader(download_dir="test_downloads", rate_limit=0.1, cache_ttl=0)
     
     def test_initialization(self, downloader):
         """Test Instagram downloader initialization"""
@@ -162,12 +162,12 @@ class TestInstagramDownloader:
         # Mock scraper
         mock_scraper = AsyncMock()
         mock_scraper.navigate_to = AsyncMock()
-        mock_scraper.get_text = AsyncMock()
-        mock_scraper.get_text.side_effect = [
-            "Test Title",  # og:title
-            "Test Description",  # og:description
-            "https://example.com/image.jpg"  # og:image
-        ]
+        mock_scraper.page_contains_text = AsyncMock(return_value=False)
+        mock_scraper.get_meta_batch = AsyncMock(return_value={
+            'og:title': "Test Title",
+            'og:description': "Test Description",
+            'og:image': "https://example.com/image.jpg"
+        })
         
         with patch('services.instagram_downloader.create_stealth_scraper', return_value=mock_scraper):
             result = await downloader.extract_content(url)
@@ -210,8 +210,7 @@ class TestInstagramDownloader:
         with patch.object(downloader, 'extract_content', return_value=mock_content_info), \
              patch('services.instagram_downloader.instaloader') as mock_instaloader, \
              patch('pathlib.Path.mkdir'), \
-             patch('builtins.open', create=True) as mock_open, \
-             patch('json.dump'):
+             patch('services.instagram_downloader._dump_json'):
             
             mock_instaloader.Post.from_shortcode.return_value = mock_post
             
@@ -238,8 +237,7 @@ class TestInstagramDownloader:
         
         with patch.object(downloader, 'extract_content', return_value=mock_content_info), \
              patch('pathlib.Path.mkdir'), \
-             patch('builtins.open', create=True), \
-             patch('json.dump'):
+             patch('services.instagram_downloader._dump_json'):
             
             result = await downloader.download_content(url)
             
@@ -277,6 +275,28 @@ class TestInstagramDownloader:
             assert results[2]['error'] is not None
             assert results[2]['status'] == 'failed'
     
+    @pytest.mark.asyncio
+    async def test_iter_bulk_content(self, downloader):
+        """Test streaming bulk content extraction"""
+        urls = [
+            "https://www.instagram.com/p/ABC123/",
+            "https://www.instagram.com/p/DEF456/",
+            "https://invalid.com/url"
+        ]
+        
+        async def mock_extract(url):
+            if url == urls[2]:
+                raise ValueError("Invalid URL")
+            return {'url': url, 'title': url[-7:-1]}
+        
+        with patch.object(downloader, 'extract_content', side_effect=mock_extract):
+            results = [result async for result in downloader.iter_bulk_content(urls)]
+            
+            by_url = {result['url']: result for result in results}
+            assert len(results) == 3
+            assert by_url[urls[0]]['title'] == 'ABC123'
+            assert by_url[urls[2]]['status'] == 'failed'
+    
     @pytest.mark.asyncio
     async def test_cleanup(self, downloader):
         """Test cleanup functionality"""
@@ -290,6 +310,25 @@ class TestInstagramDownloader:
         mock_scraper.cleanup.assert_called_once()
         assert downloader.scraper is None
     
+    @pytest.mark.asyncio
+    async def test_extract_content_uses_cache(self, tmp_path):
+        """Test that repeat extractions are served from the shortcode cache"""
+        downloader = InstagramDownloader(
+            download_dir=str(tmp_path), rate_limit=0, cache_path=str(tmp_path / "cache.sqlite3")
+        )
+        url = "https://www.instagram.com/p/ABC123/"
+        
+        mock_extract = AsyncMock(return_value={'url': url, 'shortcode': 'ABC123', 'title': 'Cached'})
+        with patch.object(downloader, '_extract_uncached', mock_extract):
+            first = await downloader.extract_content(url)
+            second = await downloader.extract_content("https://www.instagram.com/reel/ABC123/")
+            await downloader.extract_content(url, force=True)
+        
+        assert first['title'] == second['title'] == 'Cached'
+        assert second['url'] == "https://www.instagram.com/reel/ABC123/"
+        assert mock_extract.call_count == 2
+        await downloader.cleanup()
+    
     def test_create_instagram_downloader_function(self):
         """Test utility function for creating downloader"""
         downloader = create_instagram_downloader(download_dir="custom_dir", rate_limit=5.0)
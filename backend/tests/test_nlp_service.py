@@ -30,11 +30,11 @@ class TestNLPService:
     def test_nlp_service_initialization(self):
         """Test NLP service initialization"""
         assert self.nlp_service is not None
-        assert isinstance(self.nlp_service.stop_words, set)
+        assert isinstance(self.nlp_service.stop_words, frozenset)
         assert len(self.nlp_service.stop_words) > 0
-        assert isinstance(self.nlp_service.positive_words, set)
+        assert isinstance(self.nlp_service.positive_words, frozenset)
         assert len(self.nlp_service.positive_words) > 0
-        assert isinstance(self.nlp_service.negative_words, set)
+        assert isinstance(self.nlp_service.negative_words, frozenset)
         assert len(self.nlp_service.negative_words) > 0
     
     def test_text_preprocessing(self):
@@ -140,6 +140,28 @@ class TestNLPService:
         assert result.word_count == 0
         assert result.sentiment_label == "neutral"
     
+    def test_repeated_text_uses_cached_copy(self):
+        """Test that repeated texts are served from the result cache"""
+        first = self.nlp_service.analyze_text(self.positive_text)
+        first.keywords.clear()
+        
+        second = NLPService().analyze_text(self.positive_text)
+        assert second is not first
+        assert len(second.keywords) > 0
+        assert second.sentiment_label == "positive"
+    
+    def test_analyze_texts(self):
+        """Test batch analysis matches per-text analysis"""
+        texts = [self.positive_text, "", self.neutral_text, self.positive_text]
+        results = self.nlp_service.analyze_texts(texts)
+        
+        assert len(results) == 4
+        assert results[0].sentiment_label == "positive"
+        assert results[1].word_count == 0
+        assert results[0] is not results[3]
+        for text, result in zip(texts, results):
+            assert result.to_dict() == self.nlp_service.analyze_text(text).to_dict()
+    
     def test_similarity_calculation(self):
         """Test word similarity calculation"""
         similarity = self.nlp_service._calculate_similarity("python", "python")